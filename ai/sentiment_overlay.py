@@ -5,8 +5,10 @@ Can be removed if it doesn't improve performance.
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from config.settings import get_config
@@ -14,6 +16,28 @@ from config.settings import get_config
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8192)
+def _sentiment_lookup(symbol: str, date_ns: Optional[int]) -> float:
+    """
+    Memoized sentiment score lookup keyed on (symbol, date nanoseconds).
+
+    Using an int timestamp instead of a formatted string keeps the cache
+    key cheap to hash and avoids an f-string allocation per call.
+    """
+    # TODO: Implement real sentiment sources:
+    # - News API sentiment analysis
+    # - Financial news scraping
+    # - Social media sentiment
+    # - VIX levels
+    # - Market breadth indicators
+
+    # Stub: Return neutral sentiment for now
+    sentiment_score = 0.0
+
+    logger.debug(f"Sentiment for {symbol}: {sentiment_score:.2f}")
+    return sentiment_score
+
+
 class SentimentOverlay:
     """
     Sentiment analysis for filtering/confidence adjustment.
@@ -32,7 +56,6 @@ class SentimentOverlay:
             sentiment_threshold: Only allow longs if sentiment > threshold
         """
         self.sentiment_threshold = sentiment_threshold
-        self.sentiment_cache = {}
         logger.info(f"Initialized SentimentOverlay (threshold: {sentiment_threshold})")
     
     def get_sentiment(
@@ -50,24 +73,13 @@ class SentimentOverlay:
         Returns:
             Sentiment score between -1 and +1
         """
-        # TODO: Implement real sentiment sources:
-        # - News API sentiment analysis
-        # - Financial news scraping
-        # - Social media sentiment
-        # - VIX levels
-        # - Market breadth indicators
-        
-        cache_key = f"{symbol}_{date}"
-        if cache_key in self.sentiment_cache:
-            return self.sentiment_cache[cache_key]
-        
-        # Stub: Return neutral sentiment for now
-        sentiment_score = 0.0
-        
-        logger.debug(f"Sentiment for {symbol}: {sentiment_score:.2f}")
-        self.sentiment_cache[cache_key] = sentiment_score
-        
-        return sentiment_score
+        date_ns = date.value if date is not None else None
+        return _sentiment_lookup(symbol, date_ns)
+
+    @staticmethod
+    def cache_info():
+        """Hit/miss statistics of the sentiment lookup cache."""
+        return _sentiment_lookup.cache_info()
     
     def evaluate_signal(self, symbol: str, signal: int, sentiment_score: Optional[float] = None) -> (bool, float):
         """
@@ -85,22 +97,38 @@ class SentimentOverlay:
         """
         if sentiment_score is None:
             sentiment_score = self.get_sentiment(symbol)
-        
-        # Only allow LONG trades if sentiment is not too bearish
-        if signal == 1:
-            if sentiment_score < self.sentiment_threshold:
-                return False, -0.5  # Reject signal
-            else:
-                # Boost confidence if sentiment agrees
-                adjustment = min(0.3, sentiment_score * 0.5)
-                return True, adjustment
-        
-        # Always allow SHORT trades
-        if signal == -1:
-            return True, 0.0
-        
-        # Flat (hold)
-        return True, 0.0
+
+        approved, adjustments = self.evaluate_signals(
+            np.array([signal]),
+            np.array([sentiment_score]),
+        )
+        return bool(approved[0]), float(adjustments[0])
+
+    def evaluate_signals(
+        self,
+        signals: np.ndarray,
+        sentiments: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized signal evaluation for batch mode.
+
+        Same rules as evaluate_signal but branchless over whole arrays:
+        longs are rejected when sentiment is below the threshold, approved
+        longs get a confidence boost capped at 0.3, shorts and flats pass
+        through untouched.
+
+        Args:
+            signals: Signal array (1=long, 0=flat, -1=short)
+            sentiments: Sentiment scores (-1 to +1), same shape
+
+        Returns:
+            (approved: bool array, confidence adjustments: float array)
+        """
+        is_long = signals == 1
+        approved = ~(is_long & (sentiments < self.sentiment_threshold))
+        adjustments = np.where(is_long, np.minimum(0.3, sentiments * 0.5), 0.0)
+        adjustments = np.where(approved, adjustments, -0.5)
+        return approved, adjustments
     
     def calibrate(
         self,
@@ -0,0 +1,157 @@
+"""
+JIT-compiled simulation kernel for the backtesting engine.
+
+The per-bar state machine lives here as a module-level numba function
+operating on raw float64 arrays. Position-sizing math is inlined (the
+kernel receives the risk parameters, not the PositionSizer) because
+numba cannot call back into Python objects. Falls back to plain Python
+when numba is not installed (see utils._njit).
+"""
+
+import numpy as np
+
+from utils._njit import njit
+
+
+@njit(cache=True, fastmath=True)
+def _wilder_atr(high, low, close, period):
+    """
+    Average True Range with Wilder smoothing, one pass over raw arrays.
+
+    Seeded with the running mean of the first `period` true ranges, then
+    atr[i] = (atr[i-1]*(period-1) + tr[i]) / period.
+    """
+    n = high.shape[0]
+    atr = np.empty(n, np.float64)
+
+    tr_sum = high[0] - low[0]
+    atr[0] = tr_sum
+
+    for i in range(1, n):
+        tr = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        if hc > tr:
+            tr = hc
+        if lc > tr:
+            tr = lc
+
+        if i < period:
+            tr_sum += tr
+            atr[i] = tr_sum / (i + 1)
+        else:
+            atr[i] = (atr[i - 1] * (period - 1) + tr) / period
+
+    return atr
+
+
+@njit(cache=True, fastmath=True)
+def _simulate(close, atr, sig, start_cap, slip_bps, tcost, risk_pct, max_pos_pct):
+    """
+    Simulate long-only signal trading over raw arrays.
+
+    Args:
+        close: float price array
+        atr: precomputed ATR array (see _wilder_atr)
+        sig: int8 signal array (1=long, 0=flat, -1=short)
+        start_cap: starting capital
+        slip_bps: slippage in basis points
+        tcost: transaction cost fraction
+        risk_pct: risk per trade fraction
+        max_pos_pct: max position size fraction
+
+    Returns:
+        (entry_idx, exit_idx, shares, entry_px, exit_px, pnl, closed, equity)
+        where `closed` is 1 for signal exits, 0 for end-of-data closes,
+        and `equity` is the full per-bar equity curve.
+    """
+    n = close.shape[0]
+
+    # Preallocated event arrays, trimmed to the trade count on return
+    entry_idx = np.empty(n, np.int64)
+    exit_idx = np.empty(n, np.int64)
+    shares_arr = np.empty(n, np.int64)
+    entry_px = np.empty(n, np.float64)
+    exit_px = np.empty(n, np.float64)
+    pnl_arr = np.empty(n, np.float64)
+    closed = np.empty(n, np.uint8)
+
+    # Preallocated equity buffer - written once per bar, no growing list
+    equity = np.empty(n, np.float64)
+    equity[0] = start_cap
+
+    # Loop-invariant price multipliers, folded once before the loop
+    entry_mul = 1.0 + slip_bps / 10000.0
+    exit_mul = (1.0 - slip_bps / 10000.0) * (1.0 - tcost)
+
+    capital = start_cap
+    k = 0
+    in_pos = False
+    cur_entry = 0
+    cur_px = 0.0
+    cur_shares = 0
+
+    for i in range(1, n):
+        s = sig[i]
+
+        if (not in_pos) and s == 1 and sig[i - 1] != 1:
+            raw = close[i]
+            stop = raw - 2.0 * atr[i]
+
+            # Inlined risk-based position sizing
+            stop_dist = abs(raw - stop)
+            if stop_dist == 0.0:
+                sh = 0
+            else:
+                size = capital * risk_pct / stop_dist
+                max_shares = capital * max_pos_pct / raw
+                if size > max_shares:
+                    size = max_shares
+                sh = int(size)
+
+            cur_px = raw * entry_mul
+            cur_entry = i
+            cur_shares = sh
+            in_pos = True
+
+        elif in_pos and s != 1:
+            px = close[i] * exit_mul
+            pnl = (px - cur_px) * cur_shares
+
+            entry_idx[k] = cur_entry
+            exit_idx[k] = i
+            shares_arr[k] = cur_shares
+            entry_px[k] = cur_px
+            exit_px[k] = px
+            pnl_arr[k] = pnl
+            closed[k] = 1
+
+            capital += pnl
+            k += 1
+            in_pos = False
+
+        equity[i] = capital
+
+    # Close any open position at the last bar (raw close, no equity delta,
+    # matching the original engine behavior)
+    if in_pos:
+        px = close[n - 1]
+        entry_idx[k] = cur_entry
+        exit_idx[k] = n - 1
+        shares_arr[k] = cur_shares
+        entry_px[k] = cur_px
+        exit_px[k] = px
+        pnl_arr[k] = (px - cur_px) * cur_shares
+        closed[k] = 0
+        k += 1
+
+    return (
+        entry_idx[:k],
+        exit_idx[:k],
+        shares_arr[:k],
+        entry_px[:k],
+        exit_px[:k],
+        pnl_arr[:k],
+        closed[:k],
+        equity,
+    )
@@ -3,16 +3,20 @@ Backtesting engine - simulates strategy trading on historical data.
 Includes portfolio constraints, transaction costs, and slippage.
 """
 
+import hashlib
+import json
 import logging
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 import numpy as np
 import pandas as pd
 
+from backtesting._sim_njit import _simulate, _wilder_atr
 from config.settings import BacktestConfig, RiskConfig, get_config
 from risk.position_sizing import PositionSizer
-from risk.portfolio import PortfolioRiskManager, TradeRequest
 from strategies.base_strategy import BaseStrategy
 
 logger = logging.getLogger(__name__)
@@ -41,7 +45,7 @@ class BacktestResult:
     end_date: str
     
     equity_curve: pd.Series  # Daily portfolio value
-    trades: List[Trade]  # Trade list
+    trades_df: pd.DataFrame  # One row per trade, columns = Trade fields (SoA)
     
     # Performance metrics
     starting_capital: float
@@ -62,6 +66,80 @@ class BacktestResult:
     consecutive_wins: int
     consecutive_losses: int
 
+    @property
+    def trades(self) -> List[Trade]:
+        """Trade objects materialized on demand from the columnar store."""
+        return [Trade(**rec) for rec in self.trades_df.to_dict("records")]
+
+    def to_parquet(self, path: str) -> None:
+        """
+        Persist result to a directory: equity/trades as parquet tables
+        plus a small JSON header for the scalar metrics.
+
+        Args:
+            path: Directory to write into (created if missing)
+        """
+        os.makedirs(path, exist_ok=True)
+
+        header = {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name not in ("equity_curve", "trades_df")
+        }
+        with open(os.path.join(path, "header.json"), "w") as f:
+            json.dump(header, f)
+
+        self.equity_curve.to_frame("equity").to_parquet(
+            os.path.join(path, "equity.parquet"), compression="zstd"
+        )
+        self.trades_df.to_parquet(os.path.join(path, "trades.parquet"))
+
+    @classmethod
+    def from_parquet(cls, path: str, load_trades: bool = True) -> "BacktestResult":
+        """
+        Load a result written by to_parquet().
+
+        Args:
+            path: Directory containing header.json / equity.parquet / trades.parquet
+            load_trades: Skip the trade table when only the equity curve and
+                         scalar metrics are needed (e.g. dashboard overview)
+        """
+        with open(os.path.join(path, "header.json")) as f:
+            header = json.load(f)
+
+        equity_curve = pd.read_parquet(os.path.join(path, "equity.parquet"))["equity"]
+
+        if load_trades:
+            trades_df = load_trades_parquet(path)
+        else:
+            trades_df = _empty_trades_df()
+
+        return cls(equity_curve=equity_curve, trades_df=trades_df, **header)
+
+
+@lru_cache(maxsize=256)
+def _index_stats(first_ns: int, last_ns: int, n: int) -> tuple[int, float]:
+    """
+    Calendar span of a backtest window as (days, years).
+
+    Keyed on the window's first/last timestamp (ns) and bar count so
+    walk-forward runs over the same slices hit the cache instead of
+    re-boxing Timestamps.
+    """
+    days = (last_ns - first_ns) // 86_400_000_000_000
+    years = days / 365.25
+    return days, years
+
+
+def _empty_trades_df() -> pd.DataFrame:
+    """Empty trade table with the canonical Trade columns."""
+    return pd.DataFrame(columns=[f.name for f in fields(Trade)])
+
+
+def load_trades_parquet(path: str) -> pd.DataFrame:
+    """Load just the trade table from a persisted BacktestResult directory."""
+    return pd.read_parquet(os.path.join(path, "trades.parquet"))
+
 
 class BacktestEngine:
     """
@@ -79,17 +157,24 @@ class BacktestEngine:
         self,
         backtest_config: Optional[BacktestConfig] = None,
         risk_config: Optional[RiskConfig] = None,
+        signal_cache_dir: Optional[str] = "cache/signals",
     ):
         """
         Initialize backtesting engine.
-        
+
         Args:
             backtest_config: Backtesting parameters
             risk_config: Risk management parameters
+            signal_cache_dir: Directory for the on-disk signal cache
+                              (None disables caching)
         """
         self.backtest_cfg = backtest_config or get_config().backtest
         self.risk_cfg = risk_config or get_config().risk
-        
+        self.signal_cache_dir = signal_cache_dir
+
+        self._signal_cache_hits = 0
+        self._signal_cache_misses = 0
+
         self.position_sizer = PositionSizer(self.risk_cfg)
         logger.info("Initialized BacktestEngine")
     
@@ -113,11 +198,11 @@ class BacktestEngine:
         if len(data) < 100:
             raise ValueError("Insufficient data for backtesting")
         
-        # Generate signals
-        signals = strategy.generate_signals(data)
+        # Generate signals (disk-cached on strategy params + data hash)
+        signals = self._cached_signals(strategy, data)
         
         # Simulate trading
-        trades, equity_curve = self._simulate_trades(
+        trades_df, equity_curve = self._simulate_trades(
             data=data,
             signals=signals,
             strategy_name=strategy.name,
@@ -126,7 +211,7 @@ class BacktestEngine:
         
         # Calculate metrics
         result = self._calculate_metrics(
-            trades=trades,
+            trades_df=trades_df,
             equity_curve=equity_curve,
             data=data,
             strategy_name=strategy.name,
@@ -137,105 +222,178 @@ class BacktestEngine:
         
         return result
     
+    def _cached_signals(self, strategy: BaseStrategy, data: pd.DataFrame) -> pd.Series:
+        """
+        Generate strategy signals through the on-disk parquet cache.
+
+        Keyed on (strategy class, strategy params, data hash) so parameter
+        sweeps and walk-forward reruns over identical windows skip
+        generate_signals entirely.
+        """
+        if self.signal_cache_dir is None:
+            return strategy.generate_signals(data)
+
+        data_hash = hashlib.blake2b(
+            data.index.to_numpy().tobytes()
+            + data["close"].to_numpy().tobytes(),
+            digest_size=16,
+        ).hexdigest()
+        # Only stable public parameters go into the key; underscore
+        # attributes are mutable working state (indicator caches etc.)
+        # whose repr changes as the instance is used, which would turn
+        # every rerun into a spurious miss plus a duplicate cache file
+        params = json.dumps(
+            {k: v for k, v in strategy.__dict__.items() if not k.startswith("_")},
+            sort_keys=True,
+            default=str,
+        )
+        key = hashlib.blake2b(
+            f"{strategy.__class__.__name__}|{params}|{data_hash}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        path = os.path.join(self.signal_cache_dir, f"{key}.parquet")
+
+        if os.path.exists(path):
+            try:
+                signals = pd.read_parquet(path)["signal"]
+            except Exception as e:
+                logger.warning(f"Failed to read signal cache, recomputing: {e}")
+            else:
+                self._signal_cache_hits += 1
+                return signals
+
+        self._signal_cache_misses += 1
+        signals = strategy.generate_signals(data)
+
+        try:
+            os.makedirs(self.signal_cache_dir, exist_ok=True)
+            signals.to_frame("signal").to_parquet(path)
+        except Exception as e:
+            logger.warning(f"Failed to write signal cache: {e}")
+
+        return signals
+
+    def cache_info(self) -> Dict[str, int]:
+        """Hit/miss statistics of the signal disk cache."""
+        return {
+            "hits": self._signal_cache_hits,
+            "misses": self._signal_cache_misses,
+        }
+
+    def run_many(
+        self,
+        jobs: List[tuple[BaseStrategy, pd.DataFrame]],
+        n_jobs: int = -1,
+    ) -> List["BacktestResult"]:
+        """
+        Run many (strategy, data) backtests in parallel.
+
+        Per-symbol backtests are independent, so they are dispatched across
+        processes with joblib (loky backend, cloudpickle serialization).
+        Falls back to a serial loop when joblib is not installed.
+
+        Note: set OPENBLAS_NUM_THREADS=1 when running with all cores so the
+        numpy inside each worker does not oversubscribe the machine.
+
+        Args:
+            jobs: List of (strategy, OHLCV DataFrame) pairs
+            n_jobs: Worker count (-1 = all cores)
+
+        Returns:
+            List of BacktestResult in job order
+        """
+        if len(jobs) <= 1:
+            return [self.run(strategy, data) for strategy, data in jobs]
+
+        try:
+            from joblib import Parallel, delayed
+        except ImportError:
+            logger.warning("joblib not installed - running backtests serially")
+            return [self.run(strategy, data) for strategy, data in jobs]
+
+        logger.info(f"Running {len(jobs)} backtests in parallel (n_jobs={n_jobs})")
+        return Parallel(n_jobs=n_jobs, prefer="processes")(
+            delayed(self.run)(strategy, data) for strategy, data in jobs
+        )
+
     def _simulate_trades(
         self,
         data: pd.DataFrame,
         signals: pd.Series,
         strategy_name: str,
         symbol: str,
-    ) -> tuple[List[Trade], pd.Series]:
+    ) -> tuple[pd.DataFrame, pd.Series]:
         """
         Simulate trading based on signals.
-        
+
         Args:
             data: OHLCV DataFrame
             signals: Signal series (1=long, 0=flat)
             strategy_name: Strategy name
             symbol: Ticker symbol
-        
+
         Returns:
-            (trades list, equity curve Series)
+            (trades DataFrame, equity curve Series)
         """
-        trades: List[Trade] = []
-        equity = [self.risk_cfg.starting_capital]
-        current_position: Optional[Trade] = None
-        
-        # Fill NaN values in signals with 0 (no signal)
-        signals = signals.fillna(0).astype(int)
-        
-        for i in range(1, len(data)):
-            current_signal = signals.iloc[i]
-            prev_signal = signals.iloc[i - 1]
-            current_price = data["close"].iloc[i]
-            
-            # Entry signal
-            if current_signal == 1 and prev_signal != 1 and current_position is None:
-                # Calculate position size (simplified - using ATR approximation)
-                atr = data["high"].iloc[i] - data["low"].iloc[i]
-                stop_loss = current_price - (2 * atr)
-                
-                # Create trade request
-                request = TradeRequest(
-                    symbol=symbol,
-                    shares=self.position_sizer.calculate_position_size(
-                        portfolio_value=equity[-1],
-                        entry_price=current_price,
-                        stop_loss_price=stop_loss,
-                    ),
-                    entry_price=current_price,
-                    stop_loss=stop_loss,
-                )
-                
-                # Apply entry slippage
-                request.entry_price *= (1 + self.risk_cfg.slippage_bps / 10000)
-                
-                current_position = Trade(
-                    symbol=symbol,
-                    entry_date=data.index[i],
-                    entry_price=request.entry_price,
-                    shares=request.shares,
-                    reason="Signal entry",
-                )
-                
-                # Append equity (no P&L yet, just opened position)
-                equity.append(equity[-1])
-            
-            # Exit signal
-            elif (current_signal == 0 or (current_signal != 1 and current_position is not None)) and current_position is not None:
-                # Apply exit slippage
-                exit_price = current_price * (1 - self.risk_cfg.slippage_bps / 10000)
-                
-                # Apply transaction costs
-                exit_price *= (1 - self.risk_cfg.transaction_cost)
-                
-                current_position.exit_date = data.index[i]
-                current_position.exit_price = exit_price
-                current_position.pnl = (exit_price - current_position.entry_price) * current_position.shares
-                current_position.pnl_pct = (exit_price - current_position.entry_price) / current_position.entry_price
-                current_position.reason = "Signal exit"
-                
-                trades.append(current_position)
-                equity.append(equity[-1] + current_position.pnl)
-                current_position = None
-            
-            else:
-                equity.append(equity[-1])
-        
-        # Close any open position
-        if current_position is not None:
-            exit_price = data["close"].iloc[-1]
-            current_position.exit_date = data.index[-1]
-            current_position.exit_price = exit_price
-            current_position.pnl = (exit_price - current_position.entry_price) * current_position.shares
-            current_position.pnl_pct = (exit_price - current_position.entry_price) / current_position.entry_price
-            current_position.reason = "End of backtest"
-            trades.append(current_position)
-        
-        return trades, pd.Series(equity, index=data.index)
+        # Extract C-contiguous numpy arrays once - no per-bar .iloc lookups,
+        # and no strided column views from whatever block layout pandas chose
+        # (ascontiguousarray is a no-op when the column is already contiguous).
+        # Prices are float32: ~8 significant digits is plenty for quotes and
+        # it halves the memory traffic of the hot loop; the running equity
+        # stays float64 inside the kernel to avoid compounding error.
+        close = np.ascontiguousarray(data["close"].to_numpy(dtype=np.float32, copy=False))
+        high = np.ascontiguousarray(data["high"].to_numpy(dtype=np.float32, copy=False))
+        low = np.ascontiguousarray(data["low"].to_numpy(dtype=np.float32, copy=False))
+        sig = np.ascontiguousarray(signals.fillna(0).to_numpy(dtype=np.int8))
+
+        # Risk parameters read once (frozen config, no per-bar attr lookups)
+        risk = self.risk_cfg
+
+        # Real Wilder ATR precomputed in one pass (the old per-bar high-low
+        # range was a single-bar approximation, not an ATR)
+        atr = _wilder_atr(high, low, close, get_config().strategy.atr_period)
+
+        # Hot loop runs JIT-compiled (see backtesting/_sim_njit.py); only
+        # the Trade materialization below stays in Python
+        entry_idx, exit_idx, shares, entry_px, exit_px, pnl, closed, equity = _simulate(
+            close,
+            atr,
+            sig,
+            risk.starting_capital,
+            risk.slippage_bps,
+            risk.transaction_cost,
+            risk.risk_per_trade,
+            risk.max_position_size,
+        )
+
+        # Two fancy-index ops instead of one boxed pd.Timestamp per trade
+        entry_dates = data.index[entry_idx]
+        exit_dates = data.index[exit_idx]
+
+        n_trades = len(entry_idx)
+
+        # Columns match the Trade dataclass fields; symbol/reason are
+        # dictionary-encoded (1-byte codes in memory, Arrow dictionary
+        # arrays on the parquet side)
+        trades_df = pd.DataFrame({
+            "symbol": pd.Categorical([symbol] * n_trades),
+            "entry_date": entry_dates,
+            "entry_price": entry_px,
+            "exit_date": exit_dates,
+            "exit_price": exit_px,
+            "shares": shares,
+            "pnl": pnl,
+            "pnl_pct": (exit_px - entry_px) / entry_px,
+            "reason": pd.Categorical(
+                np.where(closed.astype(bool), "Signal exit", "End of backtest")
+            ),
+        })
+
+        return trades_df, pd.Series(equity, index=data.index, copy=False)
     
     def _calculate_metrics(
         self,
-        trades: List[Trade],
+        trades_df: pd.DataFrame,
         equity_curve: pd.Series,
         data: pd.DataFrame,
         strategy_name: str,
@@ -243,40 +401,44 @@ class BacktestEngine:
     ) -> BacktestResult:
         """Calculate performance metrics."""
         starting_capital = self.risk_cfg.starting_capital
-        final_value = equity_curve.iloc[-1]
+        eq = equity_curve.to_numpy()
+        final_value = eq[-1]
         total_return = (final_value - starting_capital) / starting_capital
-        
-        # CAGR
-        days = (data.index[-1] - data.index[0]).days
-        years = days / 365.25
+
+        # CAGR (calendar math memoized across walk-forward windows)
+        days, years = _index_stats(data.index[0].value, data.index[-1].value, len(data))
         cagr = ((final_value / starting_capital) ** (1 / years) - 1) if years > 0 else 0
-        
-        # Sharpe Ratio
-        daily_returns = equity_curve.pct_change().dropna()
-        sharpe = (daily_returns.mean() / daily_returns.std() * np.sqrt(252)) if daily_returns.std() > 0 else 0
-        
+
+        # Sharpe Ratio (single numpy pass, no intermediate Series)
+        rets = np.diff(eq) / eq[:-1]
+        rets_std = rets.std(ddof=1)
+        sharpe = (rets.mean() / rets_std * np.sqrt(252)) if rets_std > 0 else 0
+
         # Max Drawdown
-        cummax = equity_curve.cummax()
-        drawdown = (equity_curve - cummax) / cummax
+        cummax = np.maximum.accumulate(eq)
+        drawdown = (eq - cummax) / cummax
         max_drawdown = abs(drawdown.min())
-        
-        # Trade Statistics
-        winning_trades = [t for t in trades if t.pnl > 0]
-        losing_trades = [t for t in trades if t.pnl <= 0]
-        
-        total_wins = sum(t.pnl for t in winning_trades)
-        total_losses = abs(sum(t.pnl for t in losing_trades))
-        profit_factor = total_wins / total_losses if total_losses > 0 else 0
-        
-        win_rate = len(winning_trades) / len(trades) if trades else 0
-        
+
+        # Trade Statistics - one contiguous P&L array, masked views for aggregates
+        pnl = trades_df["pnl"].to_numpy(dtype=np.float64)
+        winning_mask = pnl > 0
+        wins = pnl[winning_mask]
+        losses = pnl[~winning_mask]
+
+        total_losses = abs(losses.sum())
+        profit_factor = wins.sum() / total_losses if total_losses > 0 else 0
+
+        win_rate = wins.size / pnl.size if pnl.size else 0
+
+        max_wins, max_losses = self._streaks(pnl)
+
         return BacktestResult(
             strategy_name=strategy_name,
             symbol=symbol,
             start_date=str(data.index[0].date()),
             end_date=str(data.index[-1].date()),
             equity_curve=equity_curve,
-            trades=trades,
+            trades_df=trades_df,
             starting_capital=starting_capital,
             final_value=final_value,
             total_return=total_return,
@@ -285,29 +447,34 @@ class BacktestEngine:
             max_drawdown=max_drawdown,
             profit_factor=profit_factor,
             win_rate=win_rate,
-            total_trades=len(trades),
-            winning_trades=len(winning_trades),
-            losing_trades=len(losing_trades),
-            avg_win=sum(t.pnl for t in winning_trades) / len(winning_trades) if winning_trades else 0,
-            avg_loss=sum(t.pnl for t in losing_trades) / len(losing_trades) if losing_trades else 0,
-            consecutive_wins=self._max_consecutive(winning_trades),
-            consecutive_losses=self._max_consecutive(losing_trades),
+            total_trades=len(trades_df),
+            winning_trades=int(wins.size),
+            losing_trades=int(losses.size),
+            avg_win=wins.mean() if wins.size else 0,
+            avg_loss=losses.mean() if losses.size else 0,
+            consecutive_wins=max_wins,
+            consecutive_losses=max_losses,
         )
-    
+
     @staticmethod
-    def _max_consecutive(trades: List[Trade]) -> int:
-        """Calculate max consecutive wins/losses."""
-        if not trades:
-            return 0
-        
-        max_streak = 0
-        current_streak = 0
-        
-        for trade in trades:
-            if trade.pnl > 0:
-                current_streak += 1
-                max_streak = max(max_streak, current_streak)
-            else:
-                current_streak = 0
-        
-        return max_streak
+    def _streaks(pnl: np.ndarray) -> tuple[int, int]:
+        """
+        Max consecutive wins and losses via run-length encoding.
+
+        One vectorized pass over the chronological P&L array (np.diff +
+        flatnonzero) instead of two Python loops. Also fixes the old
+        _max_consecutive, which counted wins inside the already-filtered
+        win/loss lists and therefore always reported 0 consecutive losses.
+        """
+        if pnl.size == 0:
+            return 0, 0
+
+        signs = (pnl > 0).astype(np.int8)
+        change = np.flatnonzero(np.diff(signs) != 0) + 1
+        runs = np.diff(np.r_[0, change, signs.size])
+        run_signs = signs[np.r_[0, change]]
+
+        max_wins = int(runs[run_signs == 1].max(initial=0))
+        max_losses = int(runs[run_signs == 0].max(initial=0))
+
+        return max_wins, max_losses
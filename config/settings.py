@@ -15,7 +15,7 @@ class SignalType(Enum):
     LONG = 1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StrategyConfig:
     """Configuration for strategy parameters."""
     # Trend Following Strategy
@@ -34,7 +34,7 @@ class StrategyConfig:
     bb_std_dev: float = 2.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskConfig:
     """Configuration for risk management."""
     starting_capital: float = 25_000.0
@@ -47,7 +47,7 @@ class RiskConfig:
     slippage_bps: float = 1.0  # 1 basis point
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BacktestConfig:
     """Configuration for backtesting."""
     #symbols: List[str] = field(default_factory=lambda: ["SPY", "QQQ", "TSLA", "MSFT","MU","NVDA ","AMD","INTC","AAPL","AMZN","GOOGL","META"])
@@ -60,7 +60,7 @@ class BacktestConfig:
     sentiment_threshold: float = -0.2
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExecutionConfig:
     """Configuration for order execution."""
     # Interactive Brokers
@@ -74,7 +74,7 @@ class ExecutionConfig:
     trade_log_path: str = "logs/trades.csv"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoggingConfig:
     """Configuration for logging."""
     level: str = "INFO"
@@ -83,7 +83,7 @@ class LoggingConfig:
     console_output: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DashboardConfig:
     """Configuration for Streamlit dashboard."""
     port: int = 8501
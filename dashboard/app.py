@@ -7,6 +7,7 @@ import sys
 import os
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 import plotly.graph_objects as go
@@ -15,10 +16,82 @@ from plotly.subplots import make_subplots
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from backtesting.engine import BacktestResult
+from dataclasses import asdict, fields
+
+from backtesting.engine import BacktestResult, Trade, load_trades_parquet
 
 logger = logging.getLogger(__name__)
 
+RESULTS_DIR = "backtest_results"
+
+
+def _downsample(series: pd.Series, n: int = 1500) -> pd.Series:
+    """
+    Stride-downsample a series to ~n points for plotting.
+
+    Multi-decade daily curves serialize tens of thousands of JSON points
+    per trace otherwise. The last point is always kept exactly so the
+    final portfolio value is correct.
+    """
+    if len(series) <= n:
+        return series
+
+    step = int(np.ceil(len(series) / n))
+    sampled = series.iloc[::step]
+
+    if sampled.index[-1] != series.index[-1]:
+        sampled = pd.concat([sampled, series.iloc[[-1]]])
+
+    return sampled
+
+
+def _series_fingerprint(series: pd.Series) -> tuple:
+    """Cheap stable hash for an equity Series (avoids hashing every row)."""
+    return (
+        series.index[0].value,
+        series.index[-1].value,
+        len(series),
+        float(series.iloc[-1]),
+    )
+
+
+@st.cache_data(hash_funcs={pd.Series: _series_fingerprint})
+def _compute_drawdown(equity: pd.Series) -> np.ndarray:
+    """Drawdown (%) of an equity curve, memoized across Streamlit reruns."""
+    arr = equity.to_numpy()
+    cummax = np.maximum.accumulate(arr)
+    # float32 on serialize - halves the plotly JSON payload
+    return ((arr - cummax) / cummax * 100).astype(np.float32)
+
+
+@st.cache_data(hash_funcs={pd.Series: _series_fingerprint})
+def _build_equity_figure(curves: tuple) -> go.Figure:
+    """Equity-curve figure, memoized on the (label, series) pairs."""
+    fig = go.Figure()
+
+    for label, equity in curves:
+        equity = _downsample(equity)
+        fig.add_trace(
+            go.Scatter(
+                x=equity.index,
+                # float32 on serialize - halves the plotly JSON payload
+                y=equity.to_numpy(np.float32),
+                mode="lines",
+                name=label,
+                hovertemplate="%{x|%Y-%m-%d}<br>$%{y:,.0f}<extra></extra>",
+            )
+        )
+
+    fig.update_layout(
+        title="Portfolio Equity Curves",
+        xaxis_title="Date",
+        yaxis_title="Portfolio Value ($)",
+        hovermode="x unified",
+        height=500,
+    )
+
+    return fig
+
 
 class TradingDashboard:
     """Streamlit dashboard for trading system monitoring."""
@@ -89,25 +162,32 @@ class TradingDashboard:
             with cols[3]:
                 st.metric("Total Trades", f"{total_trades}")
         
-        # Results table
+        # Results table - numeric columns (sortable), formatting done C-side
         st.subheader("Strategy Results")
-        
-        results_data = []
-        for result in self.results:
-            results_data.append({
-                "Strategy": result.strategy_name,
-                "Symbol": result.symbol,
-                "Return": f"{result.total_return:.1%}",
-                "CAGR": f"{result.cagr:.1%}",
-                "Sharpe": f"{result.sharpe_ratio:.2f}",
-                "Max DD": f"{result.max_drawdown:.1%}",
-                "Profit Factor": f"{result.profit_factor:.2f}",
-                "Win Rate": f"{result.win_rate:.1%}",
-                "Trades": result.total_trades,
-            })
-        
-        df_results = pd.DataFrame(results_data)
-        st.dataframe(df_results, use_container_width=True)
+
+        n = len(self.results)
+        df_results = pd.DataFrame({
+            "Strategy": [r.strategy_name for r in self.results],
+            "Symbol": [r.symbol for r in self.results],
+            "Return": np.fromiter((r.total_return for r in self.results), np.float64, n),
+            "CAGR": np.fromiter((r.cagr for r in self.results), np.float64, n),
+            "Sharpe": np.fromiter((r.sharpe_ratio for r in self.results), np.float64, n),
+            "Max DD": np.fromiter((r.max_drawdown for r in self.results), np.float64, n),
+            "Profit Factor": np.fromiter((r.profit_factor for r in self.results), np.float64, n),
+            "Win Rate": np.fromiter((r.win_rate for r in self.results), np.float64, n),
+            "Trades": np.fromiter((r.total_trades for r in self.results), np.int64, n),
+        })
+        st.dataframe(
+            df_results.style.format({
+                "Return": "{:.1%}",
+                "CAGR": "{:.1%}",
+                "Sharpe": "{:.2f}",
+                "Max DD": "{:.1%}",
+                "Profit Factor": "{:.2f}",
+                "Win Rate": "{:.1%}",
+            }),
+            use_container_width=True,
+        )
     
     def _render_equity_curves(self) -> None:
         """Render equity curves tab."""
@@ -117,29 +197,14 @@ class TradingDashboard:
             st.warning("No results to display")
             return
         
-        # Plot equity curves
-        fig = go.Figure()
-        
-        for result in self.results:
-            label = f"{result.strategy_name} ({result.symbol})"
-            fig.add_trace(
-                go.Scatter(
-                    x=result.equity_curve.index,
-                    y=result.equity_curve.values,
-                    mode="lines",
-                    name=label,
-                    hovertemplate="%{x|%Y-%m-%d}<br>$%{y:,.0f}<extra></extra>",
-                )
+        # Plot equity curves (figure construction is cached across reruns)
+        fig = _build_equity_figure(
+            tuple(
+                (f"{r.strategy_name} ({r.symbol})", r.equity_curve)
+                for r in self.results
             )
-        
-        fig.update_layout(
-            title="Portfolio Equity Curves",
-            xaxis_title="Date",
-            yaxis_title="Portfolio Value ($)",
-            hovermode="x unified",
-            height=500,
         )
-        
+
         st.plotly_chart(fig, use_container_width=True)
         
         # Drawdown chart
@@ -149,13 +214,16 @@ class TradingDashboard:
         
         for result in self.results:
             equity = result.equity_curve
-            cummax = equity.cummax()
-            drawdown = ((equity - cummax) / cummax * 100)
-            
+            # Drawdown over the full curve (cummax must see every bar),
+            # downsampled only for the plot
+            drawdown = _downsample(
+                pd.Series(_compute_drawdown(equity), index=equity.index)
+            )
+
             label = f"{result.strategy_name} ({result.symbol})"
             fig2.add_trace(
                 go.Scatter(
-                    x=equity.index,
+                    x=drawdown.index,
                     y=drawdown.values,
                     fill="tozeroy",
                     name=label,
@@ -195,27 +263,44 @@ class TradingDashboard:
         
         if not result:
             return
-        
-        # Trades table
+
+        # Trades were skipped at load time (parquet projection) - pull the
+        # trade table for the selected strategy only
+        if result.trades_df.empty and getattr(result, "trades_path", None):
+            result.trades_df = load_trades_parquet(result.trades_path)
+
+        # Trades table - columnar source, vectorized date formatting
         st.subheader("Trade List")
-        
-        trades_data = []
-        for trade in result.trades:
-            trades_data.append({
-                "Entry Date": trade.entry_date.strftime("%Y-%m-%d"),
-                "Entry Price": f"${trade.entry_price:.2f}",
-                "Exit Date": trade.exit_date.strftime("%Y-%m-%d") if trade.exit_date else "Open",
-                "Exit Price": f"${trade.exit_price:.2f}" if trade.exit_price else "-",
-                "Shares": trade.shares,
-                "P&L": f"${trade.pnl:.2f}",
-                "P&L %": f"{trade.pnl_pct:.1%}",
+
+        raw = result.trades_df
+
+        if raw.empty:
+            st.dataframe(raw, use_container_width=True)
+        else:
+            df_trades = pd.DataFrame({
+                "Entry Date": pd.to_datetime(raw["entry_date"]).dt.strftime("%Y-%m-%d"),
+                "Entry Price": raw["entry_price"],
+                "Exit Date": pd.to_datetime(raw["exit_date"]).dt.strftime("%Y-%m-%d").fillna("Open"),
+                "Exit Price": raw["exit_price"],
+                "Shares": raw["shares"],
+                "P&L": raw["pnl"],
+                "P&L %": raw["pnl_pct"],
             })
-        
-        df_trades = pd.DataFrame(trades_data)
-        st.dataframe(df_trades, use_container_width=True)
+            st.dataframe(
+                df_trades.style.format(
+                    {
+                        "Entry Price": "${:.2f}",
+                        "Exit Price": "${:.2f}",
+                        "P&L": "${:.2f}",
+                        "P&L %": "{:.1%}",
+                    },
+                    na_rep="-",
+                ),
+                use_container_width=True,
+            )
         
         # Win/Loss distribution
-        if result.trades:
+        if not result.trades_df.empty:
             cols = st.columns(3)
             
             with cols[0]:
@@ -235,29 +320,39 @@ class TradingDashboard:
             st.warning("No results to display")
             return
         
-        # Create comparison table
-        metrics_data = []
-        
-        for result in self.results:
-            metrics_data.append({
-                "Strategy": f"{result.strategy_name}",
-                "Symbol": result.symbol,
-                "Starting Capital": f"${result.starting_capital:,.0f}",
-                "Final Value": f"${result.final_value:,.0f}",
-                "Total Return": f"{result.total_return:.1%}",
-                "CAGR": f"{result.cagr:.1%}",
-                "Sharpe Ratio": f"{result.sharpe_ratio:.2f}",
-                "Max Drawdown": f"{result.max_drawdown:.1%}",
-                "Profit Factor": f"{result.profit_factor:.2f}",
-                "Win Rate": f"{result.win_rate:.1%}",
-                "Avg Win": f"${result.avg_win:.2f}",
-                "Avg Loss": f"${result.avg_loss:.2f}",
-                "Consecutive Wins": result.consecutive_wins,
-                "Total Trades": result.total_trades,
-            })
-        
-        df_metrics = pd.DataFrame(metrics_data)
-        st.dataframe(df_metrics, use_container_width=True)
+        # Comparison table - numeric columns, formatted C-side via Styler
+        n = len(self.results)
+        df_metrics = pd.DataFrame({
+            "Strategy": [r.strategy_name for r in self.results],
+            "Symbol": [r.symbol for r in self.results],
+            "Starting Capital": np.fromiter((r.starting_capital for r in self.results), np.float64, n),
+            "Final Value": np.fromiter((r.final_value for r in self.results), np.float64, n),
+            "Total Return": np.fromiter((r.total_return for r in self.results), np.float64, n),
+            "CAGR": np.fromiter((r.cagr for r in self.results), np.float64, n),
+            "Sharpe Ratio": np.fromiter((r.sharpe_ratio for r in self.results), np.float64, n),
+            "Max Drawdown": np.fromiter((r.max_drawdown for r in self.results), np.float64, n),
+            "Profit Factor": np.fromiter((r.profit_factor for r in self.results), np.float64, n),
+            "Win Rate": np.fromiter((r.win_rate for r in self.results), np.float64, n),
+            "Avg Win": np.fromiter((r.avg_win for r in self.results), np.float64, n),
+            "Avg Loss": np.fromiter((r.avg_loss for r in self.results), np.float64, n),
+            "Consecutive Wins": np.fromiter((r.consecutive_wins for r in self.results), np.int64, n),
+            "Total Trades": np.fromiter((r.total_trades for r in self.results), np.int64, n),
+        })
+        st.dataframe(
+            df_metrics.style.format({
+                "Starting Capital": "${:,.0f}",
+                "Final Value": "${:,.0f}",
+                "Total Return": "{:.1%}",
+                "CAGR": "{:.1%}",
+                "Sharpe Ratio": "{:.2f}",
+                "Max Drawdown": "{:.1%}",
+                "Profit Factor": "{:.2f}",
+                "Win Rate": "{:.1%}",
+                "Avg Win": "${:.2f}",
+                "Avg Loss": "${:.2f}",
+            }),
+            use_container_width=True,
+        )
 
 
 def run_dashboard(results: List[BacktestResult]) -> None:
@@ -271,22 +366,65 @@ def run_dashboard(results: List[BacktestResult]) -> None:
 
 
 def load_results() -> List[BacktestResult]:
-    """Load backtest results from pickle file."""
+    """
+    Load backtest results.
+
+    Prefers the parquet directory written by BacktestResult.to_parquet
+    (columnar, fast to load, trades deferred until the trade-analysis tab
+    asks for them); falls back to the legacy pickle file.
+    """
+    try:
+        if os.path.isdir(RESULTS_DIR):
+            results = []
+            for name in sorted(os.listdir(RESULTS_DIR)):
+                path = os.path.join(RESULTS_DIR, name)
+                if not os.path.isdir(path):
+                    continue
+                result = BacktestResult.from_parquet(path, load_trades=False)
+                result.trades_path = path  # for lazy trade loading
+                results.append(result)
+            if results:
+                return results
+    except Exception as e:
+        st.error(f"Failed to load parquet results: {e}")
+
+    # Legacy pickle fallback
     results_file = "backtest_results.pkl"
-    
+
     try:
         if os.path.exists(results_file):
+            import pickle
+
             with open(results_file, "rb") as f:
-                return pickle.load(f)
+                return [_upgrade_legacy_result(r) for r in pickle.load(f)]
     except Exception as e:
         st.error(f"Failed to load results: {e}")
-    
+
     return []
 
 
+def _upgrade_legacy_result(result: BacktestResult) -> BacktestResult:
+    """
+    Convert a pre-columnar pickled result in place.
+
+    Old pickles carry a `trades` list of Trade objects in the instance
+    __dict__ and no trades_df; the class-level `trades` property
+    shadows that state, so accessing it would raise. Rebuild the
+    columnar table from the legacy list and drop the shadowed entry.
+    """
+    state = result.__dict__
+    if "trades_df" in state:
+        return result
+
+    legacy = state.pop("trades", None) or []
+    if legacy:
+        state["trades_df"] = pd.DataFrame([asdict(t) for t in legacy])
+    else:
+        state["trades_df"] = pd.DataFrame(columns=[f.name for f in fields(Trade)])
+    return result
+
+
 if __name__ == "__main__":
-    import pickle
-    
     # Load results and display
     results = load_results()
     
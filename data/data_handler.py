@@ -4,15 +4,34 @@ Supports yfinance and CSV sources.
 """
 
 import logging
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, Optional
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc
 
 logger = logging.getLogger(__name__)
 
+# Lazily imported module handle: yfinance is only pulled in on first
+# use, and later calls skip the import machinery entirely
+_yf = None
+
+
+def _get_yf():
+    """Import yfinance once and cache the module handle."""
+    global _yf
+    if _yf is None:
+        import yfinance
+        _yf = yfinance
+    return _yf
+
 
 class DataSource(ABC):
     """Abstract base for data sources."""
@@ -40,7 +59,7 @@ class DataSource(ABC):
 
 class YFinanceLoader(DataSource):
     """Load data from yfinance."""
-    
+
     def fetch(
         self,
         symbol: str,
@@ -49,8 +68,8 @@ class YFinanceLoader(DataSource):
     ) -> pd.DataFrame:
         """Fetch data from yfinance."""
         try:
-            import yfinance as yf
-            
+            yf = _get_yf()
+
             data = yf.download(
                 symbol,
                 start=start_date,
@@ -81,23 +100,99 @@ class YFinanceLoader(DataSource):
             logger.error(f"Failed to load data for {symbol}: {e}")
             raise
 
+    # Yahoo caps batch requests at roughly this many symbols
+    BATCH_SIZE = 20
+
+    def fetch_many(
+        self,
+        symbols: list[str],
+        start_date: str,
+        end_date: str,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch several symbols in batched yf.download calls.
+
+        A single download request can carry ~20 tickers, so N symbols
+        cost ceil(N/20) HTTP round-trips instead of N. Symbols that come
+        back empty are skipped with a warning rather than failing the
+        whole batch.
+
+        Args:
+            symbols: Ticker symbols
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+
+        Returns:
+            Dictionary {symbol: DataFrame} for symbols that loaded
+        """
+        yf = _get_yf()
+
+        result: Dict[str, pd.DataFrame] = {}
+
+        for i in range(0, len(symbols), self.BATCH_SIZE):
+            chunk = symbols[i:i + self.BATCH_SIZE]
+            batch = yf.download(
+                " ".join(chunk),
+                start=start_date,
+                end=end_date,
+                group_by="ticker",
+                threads=True,
+                progress=False,
+            )
+
+            for symbol in chunk:
+                if isinstance(batch.columns, pd.MultiIndex):
+                    if symbol not in batch.columns.get_level_values(0):
+                        logger.warning(f"No data found for {symbol}")
+                        continue
+                    data = batch.xs(symbol, axis=1, level=0)
+                else:
+                    # Single-symbol chunk: yfinance returns flat columns
+                    data = batch
+
+                data = data.dropna(how="all")
+                if data.empty:
+                    logger.warning(f"No data found for {symbol}")
+                    continue
+
+                data = data.copy()
+                data.columns = [str(col).lower() for col in data.columns]
+                logger.info(f"Loaded {len(data)} rows for {symbol}")
+                result[symbol] = data
+
+        return result
+
 
 class DataLoader:
     """Main data loading interface."""
     
-    def __init__(self, source_type: str = "yfinance"):
+    def __init__(
+        self,
+        source_type: str = "yfinance",
+        cache_dir: Optional[str] = "./.data_cache",
+        cache_ttl: float = 86400.0,
+    ):
         """
         Initialize data loader.
-        
+
         Args:
             source_type: 'yfinance' or 'csv'
+            cache_dir: Directory for the on-disk parquet cache
+                (None disables disk caching)
+            cache_ttl: Max age in seconds before a cached file is
+                considered stale (default: 1 day)
         """
         if source_type.lower() == "yfinance":
             self.source = YFinanceLoader()
         else:
             raise ValueError(f"Unknown source type: {source_type}")
-        
+
         self._cache: Dict[str, pd.DataFrame] = {}
+        self._cache_lock = threading.Lock()
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
         logger.info(f"Initialized DataLoader with source: {source_type}")
     
     def fetch(
@@ -121,17 +216,19 @@ class DataLoader:
         """
         cache_key = f"{symbol}_{start_date}_{end_date}"
         
-        if use_cache and cache_key in self._cache:
-            logger.info(f"Using cached data for {symbol}")
-            return self._cache[cache_key].copy()
-        
+        if use_cache:
+            cached = self._load_cached(cache_key, symbol)
+            if cached is not None:
+                return cached
+
         data = self.source.fetch(symbol, start_date, end_date)
-        
+
         # Validate data
         self._validate_data(data, symbol)
-        
+        data = self._normalize_layout(data)
+
         if use_cache:
-            self._cache[cache_key] = data.copy()
+            self._store_cached(cache_key, data)
         
         return data
     
@@ -140,28 +237,180 @@ class DataLoader:
         symbols: list[str],
         start_date: str,
         end_date: str,
+        max_workers: Optional[int] = None,
     ) -> Dict[str, pd.DataFrame]:
         """
-        Fetch data for multiple symbols.
-        
+        Fetch data for multiple symbols concurrently.
+
+        Downloads are network-bound, so per-symbol fetches run in a
+        thread pool instead of a serial loop.
+
         Args:
             symbols: List of ticker symbols
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
-        
+            max_workers: Thread pool size (default: min(32, len(symbols)))
+
         Returns:
             Dictionary {symbol: DataFrame}
         """
         data_dict = {}
-        
+
+        if not symbols:
+            return data_dict
+
+        if hasattr(self.source, "fetch_many"):
+            return self._fetch_multiple_batched(symbols, start_date, end_date)
+
+        if max_workers is None:
+            max_workers = min(32, len(symbols))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.fetch, symbol, start_date, end_date): symbol
+                for symbol in symbols
+            }
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    data_dict[symbol] = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to load {symbol}: {e}")
+
+        return data_dict
+
+    def _fetch_multiple_batched(
+        self,
+        symbols: list[str],
+        start_date: str,
+        end_date: str,
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch via the source's batch API, serving cached symbols from
+        the in-memory cache and priming it with the downloaded frames
+        so later per-symbol fetch() calls stay hot.
+        """
+        data_dict = {}
+
+        missing = []
         for symbol in symbols:
+            cached = self._load_cached(f"{symbol}_{start_date}_{end_date}", symbol)
+            if cached is not None:
+                data_dict[symbol] = cached
+            else:
+                missing.append(symbol)
+
+        if not missing:
+            return data_dict
+
+        try:
+            fetched = self.source.fetch_many(missing, start_date, end_date)
+        except Exception as e:
+            logger.warning(f"Batch download failed: {e}")
+            return data_dict
+
+        for symbol, data in fetched.items():
             try:
-                data_dict[symbol] = self.fetch(symbol, start_date, end_date)
+                self._validate_data(data, symbol)
             except Exception as e:
                 logger.warning(f"Failed to load {symbol}: {e}")
-        
+                continue
+            data = self._normalize_layout(data)
+            self._store_cached(f"{symbol}_{start_date}_{end_date}", data)
+            data_dict[symbol] = data
+
         return data_dict
-    
+
+    def _load_cached(self, cache_key: str, symbol: str) -> Optional[pd.DataFrame]:
+        """
+        Look up a frame in the two-level cache: in-memory dict first
+        (L1), then the on-disk parquet store (L2). Disk hits within the
+        TTL are promoted back into memory; stale or unreadable files
+        are treated as misses.
+        """
+        if cache_key in self._cache:
+            logger.info(f"Using cached data for {symbol}")
+            return self._cache[cache_key]
+
+        if not self.cache_dir:
+            return None
+
+        path = os.path.join(self.cache_dir, f"{cache_key}.feather")
+        if not os.path.exists(path):
+            return None
+        if time.time() - os.path.getmtime(path) >= self.cache_ttl:
+            logger.info(f"Disk cache expired for {symbol}")
+            return None
+
+        try:
+            # Arrow IPC over a memory map: concurrent backtest
+            # processes share one page-cache-resident copy of the file
+            with pa.memory_map(path) as source:
+                table = pa.ipc.open_file(source).read_all()
+            try:
+                # Numeric-only frames convert as views over the mmap
+                data = table.to_pandas(zero_copy_only=True)
+            except pa.ArrowException:
+                data = table.to_pandas()
+        except Exception as e:
+            logger.warning(f"Failed to read disk cache for {symbol}: {e}")
+            return None
+
+        logger.info(f"Using disk-cached data for {symbol}")
+        self._freeze(data)
+        with self._cache_lock:
+            self._cache[cache_key] = data
+        return data
+
+    @staticmethod
+    def _normalize_layout(data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Rebuild the frame with column-major backing and compact dtypes.
+
+        Strategies consume whole columns (close, high, low), so one
+        memcpy here makes every downstream column slice stride-1
+        contiguous instead of striding across rows. Prices are
+        downcast to float32 (~7 significant digits, plenty for quote
+        prices) and volume to int32, halving the working set of every
+        downstream rolling/EMA computation.
+        """
+        price_cols = ["open", "high", "low", "close"]
+        prices = np.asfortranarray(data[price_cols].to_numpy(dtype=np.float32))
+        out = pd.DataFrame(prices, index=data.index, columns=price_cols, copy=False)
+        out["volume"] = data["volume"].to_numpy(dtype=np.int32)
+        return out
+
+    @staticmethod
+    def _freeze(data: pd.DataFrame) -> None:
+        """
+        Mark the frame's backing arrays read-only.
+
+        Cached frames are handed out without copying, so an accidental
+        in-place mutation by a caller would corrupt the cache for every
+        later consumer. Freezing turns that bug into an immediate
+        ValueError instead.
+        """
+        for block in data._mgr.blocks:
+            block.values.flags.writeable = False
+
+    def _store_cached(self, cache_key: str, data: pd.DataFrame) -> None:
+        """Write a validated frame to both cache levels."""
+        self._freeze(data)
+        # fetch() may run concurrently from fetch_multiple's thread pool
+        with self._cache_lock:
+            self._cache[cache_key] = data
+
+        if not self.cache_dir:
+            return
+        path = os.path.join(self.cache_dir, f"{cache_key}.feather")
+        try:
+            table = pa.Table.from_pandas(data)
+            with pa.OSFile(path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        except Exception as e:
+            logger.warning(f"Failed to write disk cache {path}: {e}")
+
     @staticmethod
     def _validate_data(data: pd.DataFrame, symbol: str) -> None:
         """Validate OHLCV data integrity."""
@@ -170,14 +419,18 @@ class DataLoader:
         
         if missing:
             raise ValueError(f"Missing columns for {symbol}: {missing}")
-        
+
+        # One contiguous numpy sweep instead of per-column pandas reductions;
+        # float32 matches the precision frames are stored at after ingest
+        arr = data[["open", "high", "low", "close", "volume"]].to_numpy(dtype=np.float32)
+
         # Check for NaN values
-        if data.isnull().any().any():
+        if np.isnan(arr).any():
             logger.warning(f"Data contains NaN values for {symbol}")
-            data.fillna(method="ffill", inplace=True)
-        
+            data.ffill(inplace=True)
+
         # Check for outliers (price should be positive)
-        if (data[["open", "high", "low", "close"]] <= 0).any().any():
+        if (arr[:, :4] <= 0).any():
             raise ValueError(f"Invalid price data for {symbol}")
         
         logger.info(f"Validated data for {symbol}: {len(data)} rows")
@@ -5,12 +5,37 @@ Execution engine - processes approved trades and logs execution.
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Optional
+from typing import List, NamedTuple, Optional
+
+import pandas as pd
 
 from risk.portfolio import TradeRequest
 
 logger = logging.getLogger(__name__)
 
+# Lazily imported module handle, same pattern as data_handler._get_yf
+_ib_insync = None
+
+
+def _get_ib_insync():
+    """Import ib_insync once and cache the module handle."""
+    global _ib_insync
+    if _ib_insync is None:
+        import ib_insync
+        _ib_insync = ib_insync
+    return _ib_insync
+
+
+class TradeRow(NamedTuple):
+    """One executed trade. Tuple-backed: no per-record dict allocation."""
+    id: str
+    timestamp: datetime
+    symbol: str
+    shares: int
+    entry_price: float
+    stop_loss: float
+    take_profit: Optional[float]
+
 
 class BrokerClient(ABC):
     """Abstract base for broker connections."""
@@ -60,9 +85,9 @@ class IBKRClient(BrokerClient):
     def connect(self) -> bool:
         """Connect to Interactive Brokers."""
         try:
-            from ib_insync import IB
-            
-            self._ib = IB()
+            ib = _get_ib_insync()
+
+            self._ib = ib.IB()
             self._ib.connect(self.host, self.port, clientId=self.client_id)
             self.connected = True
             logger.info("Connected to Interactive Brokers")
@@ -148,7 +173,7 @@ class ExecutionEngine:
             broker_client: BrokerClient instance (optional for backtesting)
         """
         self.broker = broker_client
-        self.trades = []
+        self.trades: List[TradeRow] = []
         logger.info("Initialized ExecutionEngine")
     
     def execute(self, request: TradeRequest) -> bool:
@@ -169,12 +194,20 @@ class ExecutionEngine:
         order_id = self.broker.place_order(request)
         
         if order_id:
-            self.trades.append({
-                "id": order_id,
-                "timestamp": datetime.now(),
-                **request.__dict__
-            })
+            self.trades.append(TradeRow(
+                id=order_id,
+                timestamp=datetime.now(),
+                symbol=request.symbol,
+                shares=request.shares,
+                entry_price=request.entry_price,
+                stop_loss=request.stop_loss,
+                take_profit=request.take_profit,
+            ))
             logger.info(f"Trade executed: {order_id}")
             return True
-        
+
         return False
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Materialize the trade log as a DataFrame in one shot."""
+        return pd.DataFrame(self.trades, columns=TradeRow._fields)
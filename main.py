@@ -3,9 +3,12 @@ Trading Fund Main Entry Point
 Production-structured systematic trading engine (Phase 1 POC)
 """
 
+import atexit
 import logging
+import logging.handlers
 import os
-import pickle
+import queue
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 
 from config.settings import SystemConfig, set_config, get_config
@@ -17,86 +20,151 @@ from strategies.strategy2_mean_reversion import MeanReversionStrategy
 
 # Configure logging
 def setup_logging(config: SystemConfig) -> None:
-    """Setup logging configuration."""
+    """
+    Setup logging configuration.
+
+    Emitters only enqueue records (a QueueHandler on the root logger);
+    a background QueueListener thread drains the queue to the file and
+    console handlers. Keeps logger.info calls on the backtest hot path
+    from blocking on disk writes.
+    """
     log_config = config.logging
-    
+
     # Create logs directory if it doesn't exist
     os.makedirs(log_config.log_dir, exist_ok=True)
-    
+
     log_path = os.path.join(log_config.log_dir, log_config.log_file)
-    
+
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    file_handler = logging.FileHandler(log_path)
+    file_handler.setFormatter(formatter)
+    console_handler = (
+        logging.StreamHandler() if log_config.console_output else logging.NullHandler()
+    )
+    console_handler.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # The listener's handlers do the real formatting; keep the
+    # enqueued record's message untouched
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     logging.basicConfig(
         level=getattr(logging, log_config.level),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler(log_path),
-            logging.StreamHandler() if log_config.console_output else logging.NullHandler(),
-        ]
+        handlers=[queue_handler],
     )
 
 
+def _run_both_strategies(symbol, data, config):
+    """
+    Backtest both strategies on one symbol.
+
+    Module-level so it pickles cleanly into ProcessPoolExecutor
+    workers; the config travels along and is installed in the worker
+    process before anything calls get_config().
+    """
+    set_config(config)
+
+    backtest_engine = BacktestEngine(
+        backtest_config=config.backtest,
+        risk_config=config.risk,
+    )
+
+    trend_strategy = TrendFollowingStrategy(symbol=symbol, config=config.strategy)
+    mr_strategy = MeanReversionStrategy(symbol=symbol, config=config.strategy)
+
+    return symbol, [
+        backtest_engine.run(trend_strategy, data),
+        backtest_engine.run(mr_strategy, data),
+    ]
+
+
+def _log_result(logger: logging.Logger, label: str, result) -> None:
+    """Log the headline metrics for one backtest result."""
+    logger.info(f"{label}:")
+    logger.info(f"  Total Return: {result.total_return:.1%}")
+    logger.info(f"  CAGR: {result.cagr:.1%}")
+    logger.info(f"  Sharpe Ratio: {result.sharpe_ratio:.2f}")
+    logger.info(f"  Max Drawdown: {result.max_drawdown:.1%}")
+    logger.info(f"  Profit Factor: {result.profit_factor:.2f}")
+    logger.info(f"  Win Rate: {result.win_rate:.1%}")
+    logger.info(f"  Trades: {result.total_trades}")
+
+
 def run_backtests() -> None:
     """Run backtesting for all strategies."""
     config = get_config()
     logger = logging.getLogger(__name__)
-    
+
     logger.info("=" * 70)
     logger.info("STARTING BACKTESTING")
     logger.info("=" * 70)
-    
-    # Load data
+
     data_loader = DataLoader(source_type=config.backtest.data_source)
-    data_dict = data_loader.fetch_multiple(
-        symbols=config.backtest.symbols,
-        start_date=config.backtest.start_date,
-        end_date=config.backtest.end_date,
-    )
-    
-    if not data_dict:
+    symbols = config.backtest.symbols
+
+    if not symbols:
         logger.error("No data loaded")
         return
-    
-    # Initialize backtesting engine
-    backtest_engine = BacktestEngine(
-        backtest_config=config.backtest,
-        risk_config=config.risk,
-    )
-    
-    # Test each strategy on each symbol
+
+    # Producer/consumer pipeline: downloads run in a thread pool and
+    # each symbol's CPU-bound backtests start in a process pool as soon
+    # as its data lands, so slow symbols don't block compute on fast ones.
     results = []
-    
-    for symbol, data in data_dict.items():
-        logger.info(f"\nTesting strategies on {symbol}")
-        logger.info("-" * 70)
-        
-        # Trend Following Strategy
-        trend_strategy = TrendFollowingStrategy(symbol=symbol, config=config.strategy)
-        result_1 = backtest_engine.run(trend_strategy, data)
-        results.append(result_1)
-        
-        logger.info(f"Trend Following:")
-        logger.info(f"  Total Return: {result_1.total_return:.1%}")
-        logger.info(f"  CAGR: {result_1.cagr:.1%}")
-        logger.info(f"  Sharpe Ratio: {result_1.sharpe_ratio:.2f}")
-        logger.info(f"  Max Drawdown: {result_1.max_drawdown:.1%}")
-        logger.info(f"  Profit Factor: {result_1.profit_factor:.2f}")
-        logger.info(f"  Win Rate: {result_1.win_rate:.1%}")
-        logger.info(f"  Trades: {result_1.total_trades}")
-        
-        # Mean Reversion Strategy
-        mr_strategy = MeanReversionStrategy(symbol=symbol, config=config.strategy)
-        result_2 = backtest_engine.run(mr_strategy, data)
-        results.append(result_2)
-        
-        logger.info(f"\nMean Reversion:")
-        logger.info(f"  Total Return: {result_2.total_return:.1%}")
-        logger.info(f"  CAGR: {result_2.cagr:.1%}")
-        logger.info(f"  Sharpe Ratio: {result_2.sharpe_ratio:.2f}")
-        logger.info(f"  Max Drawdown: {result_2.max_drawdown:.1%}")
-        logger.info(f"  Profit Factor: {result_2.profit_factor:.2f}")
-        logger.info(f"  Win Rate: {result_2.win_rate:.1%}")
-        logger.info(f"  Trades: {result_2.total_trades}")
-    
+
+    with ThreadPoolExecutor(max_workers=min(32, len(symbols))) as io_pool, \
+            ProcessPoolExecutor() as cpu_pool:
+        download_futures = {
+            io_pool.submit(
+                data_loader.fetch,
+                symbol,
+                config.backtest.start_date,
+                config.backtest.end_date,
+            ): symbol
+            for symbol in symbols
+        }
+
+        compute_futures = []
+        for future in as_completed(download_futures):
+            symbol = download_futures[future]
+            try:
+                data = future.result()
+            except Exception as e:
+                logger.warning(f"Failed to load {symbol}: {e}")
+                continue
+            compute_futures.append(
+                cpu_pool.submit(_run_both_strategies, symbol, data, config)
+            )
+
+        if not compute_futures:
+            logger.error("No data loaded")
+            return
+
+        for future in as_completed(compute_futures):
+            try:
+                symbol, symbol_results = future.result()
+            except Exception as e:
+                logger.error(f"Backtest failed: {e}")
+                continue
+
+            logger.info(f"\nTesting strategies on {symbol}")
+            logger.info("-" * 70)
+            _log_result(logger, "Trend Following", symbol_results[0])
+            _log_result(logger, "\nMean Reversion", symbol_results[1])
+            results.extend(symbol_results)
+
+    if not results:
+        logger.error("All backtests failed")
+        return
+
     logger.info("\n" + "=" * 70)
     logger.info("BACKTESTING COMPLETE")
     logger.info("=" * 70)
@@ -113,12 +181,15 @@ def run_backtests() -> None:
     logger.info(f"Average Return: {avg_return:.1%}")
     logger.info(f"Average Max Drawdown: {avg_dd:.1%}")
     
-    # Save results to file for dashboard
-    results_file = "backtest_results.pkl"
+    # Save results for the dashboard: one parquet directory per result
+    # (header + equity curve + trades), columnar and compressed
+    results_dir = "backtest_results"
     try:
-        with open(results_file, "wb") as f:
-            pickle.dump(results, f)
-        logger.info(f"\nResults saved to {results_file}")
+        os.makedirs(results_dir, exist_ok=True)
+        for result in results:
+            name = f"{result.strategy_name}_{result.symbol}".replace(" ", "_").lower()
+            result.to_parquet(os.path.join(results_dir, name))
+        logger.info(f"\nResults saved to {results_dir}/")
     except Exception as e:
         logger.warning(f"Failed to save results: {e}")
 
@@ -0,0 +1,59 @@
+"""
+JIT-compiled risk kernels.
+
+Scalar sizing/validation math runs once per signal during backtests,
+so it lives here as a numba function free of CPython dispatch
+overhead. Falls back to plain Python when numba is not installed
+(see utils._njit).
+"""
+
+from utils._njit import njit
+
+# Reason codes returned by size_and_validate
+REASON_OK = 0
+REASON_ZERO_STOP = 1
+REASON_RESIZED = 2
+REASON_RISK_EXCEEDED = 3
+
+
+@njit(cache=True)
+def size_and_validate(entry_price, stop_loss, requested_shares, risk_amount, max_pos_value):
+    """
+    Size or validate a single trade against risk limits.
+
+    With requested_shares < 0, runs in sizing mode: returns the
+    risk-based position size capped at the max position value.
+    Otherwise validates the requested share count, suggesting a resize
+    when the position is too large and rejecting when the trade risk
+    exceeds the risk budget.
+
+    Args:
+        entry_price: Entry price
+        stop_loss: Stop loss price
+        requested_shares: Shares to validate, or -1 to compute a size
+        risk_amount: Capital at risk per trade (capital * risk_per_trade)
+        max_pos_value: Max position value (capital * max_position_size)
+
+    Returns:
+        (shares, reason_code) with reason_code one of the REASON_*
+        constants; shares is the resized count for REASON_RESIZED
+    """
+    stop_distance = abs(entry_price - stop_loss)
+    max_shares = max_pos_value / entry_price
+
+    if requested_shares < 0:
+        if stop_distance == 0.0:
+            return 0, REASON_ZERO_STOP
+        size = risk_amount / stop_distance
+        if size > max_shares:
+            size = max_shares
+        return int(size), REASON_OK
+
+    if requested_shares * entry_price > max_pos_value:
+        return int(max_shares), REASON_RESIZED
+
+    # A zero stop distance carries zero risk, so it always passes here
+    if requested_shares * stop_distance > risk_amount:
+        return 0, REASON_RISK_EXCEEDED
+
+    return requested_shares, REASON_OK
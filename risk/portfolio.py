@@ -6,12 +6,19 @@ import logging
 from dataclasses import dataclass, field
 from typing import Dict, Optional
 
+import numpy as np
+
 from config.settings import RiskConfig, get_config
+from risk._numba_kernels import (
+    REASON_RESIZED,
+    REASON_RISK_EXCEEDED,
+    size_and_validate,
+)
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Represents an open trade position."""
     symbol: str
@@ -23,7 +30,7 @@ class Position:
     pnl: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeRequest:
     """Request to open a position."""
     symbol: str
@@ -33,14 +40,20 @@ class TradeRequest:
     take_profit: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradeApproval:
-    """Decision on whether to approve a trade."""
+    """Decision on whether to approve a trade. Immutable, so the
+    common outcomes can be shared as preallocated singletons."""
     approved: bool
     reason: str
     adjusted_shares: Optional[int] = None
 
 
+# The plain-approval outcome carries no per-call data; every approved
+# trade shares this one instance
+_APPROVED = TradeApproval(approved=True, reason="Trade approved")
+
+
 class PortfolioRiskManager:
     """
     Manages portfolio-level risk constraints:
@@ -58,14 +71,50 @@ class PortfolioRiskManager:
             config: RiskConfig with parameters
         """
         self.config = config or get_config().risk
-        
-        self.positions: Dict[str, Position] = {}
+
+        # Positions are stored structure-of-arrays: parallel numpy
+        # columns plus a symbol -> slot index map. Portfolio-level
+        # aggregates (value, exposure) then reduce over contiguous
+        # arrays instead of walking Python objects per position.
+        capacity = max(self.config.max_concurrent_trades, 8)
+        self._symbols = np.empty(capacity, dtype=object)
+        self._shares = np.zeros(capacity, dtype=np.int32)
+        self._entry_prices = np.zeros(capacity, dtype=np.float32)
+        self._stop_losses = np.zeros(capacity, dtype=np.float32)
+        self._current_prices = np.full(capacity, np.nan, dtype=np.float32)
+        self._symbol_to_idx: Dict[str, int] = {}
+        self._n_positions = 0
+
         self.daily_loss = 0.0
         self.monthly_loss = 0.0
         self.starting_capital = self.config.starting_capital
         self.current_capital = self.config.starting_capital
-        
+        self._refresh_limits()
+
+        # Rejection outcomes whose reasons depend only on config are
+        # allocated once; validate_trade hands them out on every reject
+        self._rej_max_trades = TradeApproval(
+            approved=False,
+            reason=f"Max {self.config.max_concurrent_trades} concurrent trades reached",
+        )
+        self._rej_daily_loss = TradeApproval(
+            approved=False,
+            reason=f"Daily loss limit ({self.config.daily_loss_limit:.1%}) exceeded",
+        )
+
         logger.info(f"Initialized PortfolioRiskManager (capital: ${self.current_capital:,.0f})")
+
+    def _refresh_limits(self) -> None:
+        """
+        Recompute capital-dependent limits used on every trade check.
+
+        validate_trade runs per signal, so the three products of
+        current capital and config fractions are cached here and only
+        refreshed when capital actually changes (close_position).
+        """
+        self._max_pos_value = self.current_capital * self.config.max_position_size
+        self._daily_loss_cap = self.current_capital * self.config.daily_loss_limit
+        self._max_risk = self.current_capital * self.config.risk_per_trade
     
     def validate_trade(self, request: TradeRequest) -> TradeApproval:
         """
@@ -78,44 +127,37 @@ class PortfolioRiskManager:
             TradeApproval with decision and reason
         """
         # Check max concurrent trades
-        if len(self.positions) >= self.config.max_concurrent_trades:
-            return TradeApproval(
-                approved=False,
-                reason=f"Max {self.config.max_concurrent_trades} concurrent trades reached"
-            )
-        
-        # Check position size
-        position_value = request.shares * request.entry_price
-        position_pct = position_value / self.current_capital
+        if self._n_positions >= self.config.max_concurrent_trades:
+            return self._rej_max_trades
         
-        if position_pct > self.config.max_position_size:
-            # Suggest resizing
-            max_shares = int((self.current_capital * self.config.max_position_size) / request.entry_price)
+        # Size and risk checks run in the compiled kernel
+        shares, code = size_and_validate(
+            float(request.entry_price),
+            float(request.stop_loss),
+            request.shares,
+            self._max_risk,
+            self._max_pos_value,
+        )
+
+        if code == REASON_RESIZED:
             return TradeApproval(
                 approved=True,
-                reason=f"Position resized: {request.shares} → {max_shares} shares",
-                adjusted_shares=max_shares
+                reason=f"Position resized: {request.shares} → {shares} shares",
+                adjusted_shares=shares
             )
-        
+
         # Check daily loss limit
-        if self.daily_loss >= self.current_capital * self.config.daily_loss_limit:
-            return TradeApproval(
-                approved=False,
-                reason=f"Daily loss limit ({self.config.daily_loss_limit:.1%}) exceeded"
-            )
-        
-        # Check risk per trade
-        stop_distance = abs(request.entry_price - request.stop_loss)
-        trade_risk = request.shares * stop_distance
-        max_risk = self.current_capital * self.config.risk_per_trade
-        
-        if trade_risk > max_risk:
+        if self.daily_loss >= self._daily_loss_cap:
+            return self._rej_daily_loss
+
+        if code == REASON_RISK_EXCEEDED:
+            trade_risk = request.shares * abs(request.entry_price - request.stop_loss)
             return TradeApproval(
                 approved=False,
-                reason=f"Trade risk ${trade_risk:.0f} > max ${max_risk:.0f}"
+                reason=f"Trade risk ${trade_risk:.0f} > max ${self._max_risk:.0f}"
             )
-        
-        return TradeApproval(approved=True, reason="Trade approved")
+
+        return _APPROVED
     
     def open_position(self, request: TradeRequest) -> bool:
         """
@@ -135,19 +177,31 @@ class PortfolioRiskManager:
         
         # Use adjusted shares if provided
         shares = approval.adjusted_shares or request.shares
-        
-        position = Position(
-            symbol=request.symbol,
-            shares=shares,
-            entry_price=request.entry_price,
-            stop_loss=request.stop_loss,
-            entry_date="",  # Will be set by execution engine
-        )
-        
-        self.positions[request.symbol] = position
+
+        idx = self._n_positions
+        if idx == len(self._shares):
+            self._grow()
+
+        self._symbols[idx] = request.symbol
+        self._shares[idx] = shares
+        self._entry_prices[idx] = request.entry_price
+        self._stop_losses[idx] = request.stop_loss
+        self._current_prices[idx] = np.nan
+        self._symbol_to_idx[request.symbol] = idx
+        self._n_positions = idx + 1
+
         logger.info(f"Position opened: {shares} {request.symbol} @ ${request.entry_price:.2f}")
-        
+
         return True
+
+    def _grow(self) -> None:
+        """Double the capacity of the position arrays."""
+        new_cap = len(self._shares) * 2
+        for name in ("_symbols", "_shares", "_entry_prices", "_stop_losses", "_current_prices"):
+            old = getattr(self, name)
+            new = np.empty(new_cap, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
     
     def close_position(self, symbol: str, exit_price: float) -> float:
         """
@@ -160,23 +214,34 @@ class PortfolioRiskManager:
         Returns:
             P&L amount
         """
-        if symbol not in self.positions:
+        idx = self._symbol_to_idx.pop(symbol, None)
+        if idx is None:
             logger.warning(f"Position {symbol} not found")
             return 0.0
-        
-        pos = self.positions[symbol]
-        pnl = (exit_price - pos.entry_price) * pos.shares
-        
+
+        pnl = (exit_price - float(self._entry_prices[idx])) * int(self._shares[idx])
+
+        # Swap-and-pop: move the last slot into the freed one so the
+        # live positions stay packed at the front of each array
+        last = self._n_positions - 1
+        if idx != last:
+            for arr in (self._symbols, self._shares, self._entry_prices,
+                        self._stop_losses, self._current_prices):
+                arr[idx] = arr[last]
+            self._symbol_to_idx[self._symbols[idx]] = idx
+        self._symbols[last] = None
+        self._n_positions = last
+
         # Update capital and loss tracking
         self.current_capital += pnl
-        
+        self._refresh_limits()
+
         if pnl < 0:
             self.daily_loss += abs(pnl)
             self.monthly_loss += abs(pnl)
-        
-        del self.positions[symbol]
+
         logger.info(f"Position closed: {symbol} | P&L: ${pnl:.2f}")
-        
+
         return pnl
     
     def update_prices(self, prices: Dict[str, float]) -> None:
@@ -187,24 +252,40 @@ class PortfolioRiskManager:
             prices: Dict of {symbol: price}
         """
         for symbol, price in prices.items():
-            if symbol in self.positions:
-                self.positions[symbol].current_price = price
-    
+            idx = self._symbol_to_idx.get(symbol)
+            if idx is not None:
+                self._current_prices[idx] = price
+
+    @property
+    def positions(self) -> Dict[str, Position]:
+        """Open positions materialized as Position objects (for inspection)."""
+        result = {}
+        for symbol, idx in self._symbol_to_idx.items():
+            cur = float(self._current_prices[idx])
+            result[symbol] = Position(
+                symbol=symbol,
+                shares=int(self._shares[idx]),
+                entry_price=float(self._entry_prices[idx]),
+                stop_loss=float(self._stop_losses[idx]),
+                entry_date="",
+                current_price=None if np.isnan(cur) else cur,
+            )
+        return result
+
     def get_portfolio_value(self) -> float:
         """Calculate total portfolio value (capital + open P&L)."""
-        unrealized_pnl = sum(
-            (pos.current_price - pos.entry_price) * pos.shares
-            for pos in self.positions.values()
-            if pos.current_price is not None
-        )
-        return self.current_capital + unrealized_pnl
-    
+        n = self._n_positions
+        cur = self._current_prices[:n]
+        priced = ~np.isnan(cur)
+        unrealized_pnl = np.where(
+            priced, (cur - self._entry_prices[:n]) * self._shares[:n], 0.0
+        ).sum()
+        return self.current_capital + float(unrealized_pnl)
+
     def get_exposure(self) -> float:
         """Get current portfolio exposure (% of capital)."""
-        total_exposure = sum(
-            pos.shares * pos.entry_price
-            for pos in self.positions.values()
-        )
+        n = self._n_positions
+        total_exposure = float((self._shares[:n] * self._entry_prices[:n]).sum())
         return total_exposure / self.current_capital
     
     def check_kill_switch(self) -> bool:
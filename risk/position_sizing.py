@@ -5,7 +5,10 @@ Position sizing module - calculates position size based on risk parameters.
 import logging
 from typing import Optional
 
+import numpy as np
+
 from config.settings import RiskConfig, get_config
+from risk._numba_kernels import size_and_validate
 
 logger = logging.getLogger(__name__)
 
@@ -49,23 +52,52 @@ class PositionSizer:
         Returns:
             Number of shares to buy
         """
-        stop_distance = abs(entry_price - stop_loss_price)
-        
-        if stop_distance == 0:
+        if entry_price == stop_loss_price:
             logger.warning("Stop distance is 0, cannot size position")
             return 0
-        
+
+        shares, _ = size_and_validate(
+            float(entry_price),
+            float(stop_loss_price),
+            -1,
+            portfolio_value * self.config.risk_per_trade,
+            portfolio_value * self.config.max_position_size,
+        )
+        return shares
+
+    def calculate_position_sizes(
+        self,
+        portfolio_value: float,
+        entry_prices: np.ndarray,
+        stop_loss_prices: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Vectorized position sizing for a batch of candidate trades.
+
+        Same formula as calculate_position_size, applied across whole
+        arrays in four numpy ops. Entries with a zero stop distance
+        size to 0 shares.
+
+        Args:
+            portfolio_value: Current portfolio value
+            entry_prices: Entry price per candidate
+            stop_loss_prices: Stop loss price per candidate, same shape
+
+        Returns:
+            int32 array of shares to buy per candidate
+        """
+        stop_distances = np.abs(entry_prices - stop_loss_prices)
         risk_amount = portfolio_value * self.config.risk_per_trade
-        position_size = risk_amount / stop_distance
-        
+
+        with np.errstate(divide="ignore"):
+            sizes = np.where(stop_distances > 0, risk_amount / stop_distances, 0.0)
+
         # Cap by max position size (10% of capital)
         max_position_value = portfolio_value * self.config.max_position_size
-        max_shares = max_position_value / entry_price
-        
-        position_size = min(position_size, max_shares)
-        
-        return int(position_size)
-    
+        max_shares = max_position_value / entry_prices
+
+        return np.minimum(sizes, max_shares).astype(np.int32)
+
     def calculate_stop_loss(
         self,
         entry_price: float,
@@ -0,0 +1,395 @@
+"""
+JIT-compiled indicator kernels for the strategies.
+
+Recursive indicators (EMA and friends) are defined by per-bar
+recurrences that pandas can only express through heavyweight ewm/
+rolling machinery; here they are plain numba loops. Falls back to
+plain Python when numba is not installed (see utils._njit).
+
+Kernels work in float32: price data carries nowhere near double
+precision and the thresholds compared against (ADX/RSI levels, band
+breaches) are coarse, so halving the element width halves memory
+bandwidth and doubles the SIMD lane count. Wilder-smoothed state is
+float32 too - exponential smoothing forgets rounding error
+geometrically - but the Bollinger running window sums stay float64,
+because running add/subtract error is *not* self-correcting and
+accumulates without bound over a long series.
+
+Each kernel declares an explicit signature, so compilation happens
+eagerly at import time rather than on first call, and cache=True
+persists the compiled code on disk - short-lived processes (CI,
+per-symbol backtest workers) skip recompilation entirely. Set
+NUMBA_CACHE_DIR if the workers should share a cache outside the
+source tree.
+"""
+
+import numpy as np
+
+from utils._njit import HAS_NUMBA, njit, prange
+
+if HAS_NUMBA:
+    # Signatures are built from type objects rather than strings because
+    # the input arrays must be declared readonly: pandas hands out
+    # read-only views from zero-copy to_numpy(), and the frozen cache
+    # frames are read-only by design. A writable array still dispatches
+    # to a readonly parameter, so these cover both.
+    from numba.core import types
+
+    _f4 = types.float32
+    _i8 = types.int64
+    _f4_in = types.Array(types.float32, 1, "C", readonly=True)
+    _SIG_EMA = types.float32[:](_f4_in, _f4)
+    _SIG_EMA3 = types.UniTuple(types.float32[:], 3)(_f4_in, _f4, _f4, _f4)
+    _SIG_RSI = types.float32[:](_f4_in, _i8)
+    _SIG_BB = types.UniTuple(types.float32[:], 3)(_f4_in, _i8, _f4)
+    _SIG_MR = types.int8[:](_f4_in, _i8, _i8, _f4, _f4, _f4)
+    _SIG_ADX = types.float32[:](_f4_in, _f4_in, _f4_in, _i8)
+else:
+    # The no-op shim ignores signatures entirely
+    _SIG_EMA = _SIG_EMA3 = _SIG_RSI = _SIG_BB = _SIG_MR = _SIG_ADX = None
+
+
+@njit(_SIG_EMA, cache=True, fastmath=True)
+def _ema_loop(x, alpha):
+    """
+    Exponential moving average, y[i] = alpha*x[i] + (1-alpha)*y[i-1].
+
+    Seeded with x[0], matching ewm(span=..., adjust=False).mean().
+    """
+    n = x.shape[0]
+    out = np.empty(n, np.float32)
+    beta = np.float32(1.0) - alpha
+    out[0] = x[0]
+    for i in range(1, n):
+        out[i] = alpha * x[i] + beta * out[i - 1]
+    return out
+
+
+@njit(_SIG_EMA3, cache=True, fastmath=True)
+def _ema_triple(x, alpha_fast, alpha_slow, alpha_long):
+    """
+    Fast/slow/long EMAs fused into one pass.
+
+    Same recursion as _ema_loop, but the price array is read once and
+    three running states updated per bar - a third of the memory
+    traffic of three separate passes.
+    """
+    n = x.shape[0]
+    out_f = np.empty(n, np.float32)
+    out_s = np.empty(n, np.float32)
+    out_l = np.empty(n, np.float32)
+
+    beta_f = np.float32(1.0) - alpha_fast
+    beta_s = np.float32(1.0) - alpha_slow
+    beta_l = np.float32(1.0) - alpha_long
+
+    ef = x[0]
+    es = x[0]
+    el = x[0]
+    out_f[0] = ef
+    out_s[0] = es
+    out_l[0] = el
+
+    for i in range(1, n):
+        xi = x[i]
+        ef = alpha_fast * xi + beta_f * ef
+        es = alpha_slow * xi + beta_s * es
+        el = alpha_long * xi + beta_l * el
+        out_f[i] = ef
+        out_s[i] = es
+        out_l[i] = el
+
+    return out_f, out_s, out_l
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _ema_triple_batch(X, alpha_fast, alpha_slow, alpha_long):
+    """
+    _ema_triple over a (symbols, bars) matrix, one thread per row.
+
+    Deliberately compiled lazily (no explicit signature, unlike the
+    kernels above): compiling a parallel=True kernel initializes
+    numba's threading layer, which is fork-unsafe - doing that at
+    import time in the parent process deadlocks any later fork-based
+    ProcessPoolExecutor (main.run_backtests) at interpreter shutdown.
+    Compiling on first call keeps importers that never touch the
+    batch path fork-clean.
+
+    The recurrence is serial in time but independent across symbols,
+    so prange hands each row to a thread which runs the series
+    end-to-end out of its own cache. Rows shorter than the matrix
+    width are NaN-padded on the right; NaN propagates through the
+    recurrence, so the padded tail comes back NaN and callers slice
+    it off by length.
+    """
+    n_sym, n = X.shape
+    out_f = np.empty((n_sym, n), np.float32)
+    out_s = np.empty((n_sym, n), np.float32)
+    out_l = np.empty((n_sym, n), np.float32)
+
+    beta_f = np.float32(1.0) - alpha_fast
+    beta_s = np.float32(1.0) - alpha_slow
+    beta_l = np.float32(1.0) - alpha_long
+
+    for r in prange(n_sym):
+        ef = X[r, 0]
+        es = ef
+        el = ef
+        out_f[r, 0] = ef
+        out_s[r, 0] = es
+        out_l[r, 0] = el
+        for i in range(1, n):
+            xi = X[r, i]
+            ef = alpha_fast * xi + beta_f * ef
+            es = alpha_slow * xi + beta_s * es
+            el = alpha_long * xi + beta_l * el
+            out_f[r, i] = ef
+            out_s[r, i] = es
+            out_l[r, i] = el
+
+    return out_f, out_s, out_l
+
+
+@njit(_SIG_RSI, cache=True, fastmath=True)
+def _rsi_kernel(x, period):
+    """
+    RSI with Wilder's recursive smoothing.
+
+    Average gain/loss are seeded with a simple mean over the first
+    `period` moves, then smoothed as avg = (avg*(period-1) + move)/period.
+    Bars before the seed window are neutral (50), matching the
+    previous fillna(50) behavior.
+    """
+    n = x.shape[0]
+    zero = np.float32(0.0)
+    one = np.float32(1.0)
+    fifty = np.float32(50.0)
+    hundred = np.float32(100.0)
+    p = np.float32(period)
+
+    rsi = np.full(n, fifty, np.float32)
+    if n <= period:
+        return rsi
+
+    half = np.float32(0.5)
+    avg_gain = zero
+    avg_loss = zero
+    for i in range(1, period + 1):
+        d = x[i] - x[i - 1]
+        avg_gain += (d + abs(d)) * half
+        avg_loss += (abs(d) - d) * half
+    avg_gain /= p
+    avg_loss /= p
+
+    for i in range(period, n):
+        if i > period:
+            d = x[i] - x[i - 1]
+            # Branchless clamps: (d+|d|)/2 is max(d,0), (|d|-d)/2 is max(-d,0)
+            avg_gain = (avg_gain * (p - one) + (d + abs(d)) * half) / p
+            avg_loss = (avg_loss * (p - one) + (abs(d) - d) * half) / p
+
+        if avg_loss > zero:
+            rs = avg_gain / avg_loss
+            rsi[i] = hundred - hundred / (one + rs)
+        elif avg_gain > zero:
+            rsi[i] = hundred
+
+    return rsi
+
+
+@njit(_SIG_BB, cache=True, fastmath=True)
+def _bb_kernel(x, period, num_std):
+    """
+    Bollinger Bands via running window sums.
+
+    Maintains S and S2 over the window and uses
+    var = (S2 - n*mean^2)/(n-1), so mean and (Bessel-corrected) std
+    come out of one O(n) pass instead of two separate rolling
+    reductions. The sums are carried in float64 (see module docstring)
+    and S2 cancellation is clamped at zero. The first period-1 bars
+    are NaN like rolling().
+    """
+    n = x.shape[0]
+    upper = np.full(n, np.nan, np.float32)
+    mid = np.full(n, np.nan, np.float32)
+    lower = np.full(n, np.nan, np.float32)
+
+    s = 0.0
+    s2 = 0.0
+    for i in range(n):
+        xi = np.float64(x[i])
+        s += xi
+        s2 += xi * xi
+        if i >= period:
+            xo = np.float64(x[i - period])
+            s -= xo
+            s2 -= xo * xo
+        if i >= period - 1:
+            mean = s / period
+            var = (s2 - period * mean * mean) / (period - 1)
+            if var < 0.0:
+                var = 0.0
+            band = num_std * np.sqrt(var)
+            mid[i] = mean
+            upper[i] = mean + band
+            lower[i] = mean - band
+
+    return upper, mid, lower
+
+
+@njit(_SIG_MR, cache=True, fastmath=True)
+def _mean_rev_signals(x, rsi_period, bb_period, num_std, rsi_entry, rsi_exit):
+    """
+    Fused mean-reversion signal kernel.
+
+    Streams the close array once, carrying the Wilder RSI state and
+    the Bollinger window sums side by side, and emits the int8 signal
+    directly: 1 where RSI < rsi_entry and close < lower band, forced
+    flat where RSI > rsi_exit or close > upper band. Matches composing
+    _rsi_kernel + _bb_kernel with the strategy's boolean masks, minus
+    the five intermediate arrays.
+    """
+    n = x.shape[0]
+    out = np.zeros(n, np.int8)
+
+    zero = np.float32(0.0)
+    one = np.float32(1.0)
+    fifty = np.float32(50.0)
+    hundred = np.float32(100.0)
+    rp = np.float32(rsi_period)
+    half = np.float32(0.5)
+
+    avg_gain = zero
+    avg_loss = zero
+    s = 0.0
+    s2 = 0.0
+
+    for i in range(n):
+        xi = x[i]
+
+        # Wilder RSI state (branchless clamps, see _rsi_kernel)
+        if i >= 1:
+            d = xi - x[i - 1]
+            gain = (d + abs(d)) * half
+            loss = (abs(d) - d) * half
+            if i <= rsi_period:
+                avg_gain += gain
+                avg_loss += loss
+                if i == rsi_period:
+                    avg_gain /= rp
+                    avg_loss /= rp
+            else:
+                avg_gain = (avg_gain * (rp - one) + gain) / rp
+                avg_loss = (avg_loss * (rp - one) + loss) / rp
+
+        if i < rsi_period:
+            rsi = fifty
+        elif avg_loss > zero:
+            rsi = hundred - hundred / (one + avg_gain / avg_loss)
+        elif avg_gain > zero:
+            rsi = hundred
+        else:
+            rsi = fifty
+
+        # Bollinger window sums (float64, see module docstring)
+        xd = np.float64(xi)
+        s += xd
+        s2 += xd * xd
+        if i >= bb_period:
+            xo = np.float64(x[i - bb_period])
+            s -= xo
+            s2 -= xo * xo
+
+        if i < bb_period - 1:
+            # Bands undefined: both conditions false, stay flat
+            continue
+
+        mean = s / bb_period
+        var = (s2 - bb_period * mean * mean) / (bb_period - 1)
+        if var < 0.0:
+            var = 0.0
+        band = num_std * np.sqrt(var)
+
+        if rsi > rsi_exit or xd > mean + band:
+            out[i] = 0
+        elif rsi < rsi_entry and xd < mean - band:
+            out[i] = 1
+
+    return out
+
+
+@njit(_SIG_ADX, cache=True, fastmath=True)
+def _adx_kernel(high, low, close, period):
+    """
+    ADX in one pass with Wilder's recursive smoothing.
+
+    Directional movement, true range, the smoothed DI ratios and the
+    final DX smoothing all happen in a single loop - no intermediate
+    arrays beyond the output. Bars before the first full smoothing
+    window are 0, matching the previous fillna(0) behavior.
+    """
+    n = high.shape[0]
+    adx = np.zeros(n, np.float32)
+    if n < 2 * period:
+        return adx
+
+    zero = np.float32(0.0)
+    one = np.float32(1.0)
+    hundred = np.float32(100.0)
+    p = np.float32(period)
+
+    # Wilder smoothed sums, seeded with the sum of the first `period`
+    # raw values, then s = s - s/period + x
+    str_ = zero
+    spdm = zero
+    smdm = zero
+    dx_sum = zero
+    adx_prev = zero
+
+    for i in range(1, n):
+        up = high[i] - high[i - 1]
+        dn = low[i - 1] - low[i]
+        # Branchless directional movement: the bool collapses to 0/1,
+        # so LLVM emits a select + max instead of a data-dependent jump
+        pdm = np.float32(up > dn) * max(up, zero)
+        mdm = np.float32(dn > up) * max(dn, zero)
+
+        tr = max(
+            high[i] - low[i],
+            abs(high[i] - close[i - 1]),
+            abs(low[i] - close[i - 1]),
+        )
+
+        if i <= period:
+            str_ += tr
+            spdm += pdm
+            smdm += mdm
+            if i < period:
+                continue
+        else:
+            str_ += tr - str_ / p
+            spdm += pdm - spdm / p
+            smdm += mdm - smdm / p
+
+        if str_ > zero:
+            pdi = hundred * spdm / str_
+            mdi = hundred * smdm / str_
+        else:
+            pdi = zero
+            mdi = zero
+
+        di_sum = pdi + mdi
+        dx = hundred * abs(pdi - mdi) / di_sum if di_sum > zero else zero
+
+        if i < 2 * period - 1:
+            dx_sum += dx
+        elif i == 2 * period - 1:
+            # First ADX value: simple mean of the first `period` DX values
+            dx_sum += dx
+            adx_prev = dx_sum / p
+            adx[i] = adx_prev
+        else:
+            adx_prev = (adx_prev * (p - one) + dx) / p
+            adx[i] = adx_prev
+
+    return adx
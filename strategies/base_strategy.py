@@ -8,11 +8,16 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 import pandas as pd
+from cachetools import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# Shared in-process signal memo; keyed on strategy class, parameters
+# and a cheap fingerprint of the input frame
+_signal_cache: LRUCache = LRUCache(maxsize=64)
 
-@dataclass
+
+@dataclass(slots=True)
 class SignalOutput:
     """Output from strategy signal generation."""
     signal: int  # 1 (long), 0 (flat), -1 (short)
@@ -24,11 +29,23 @@ class SignalOutput:
 class BaseStrategy(ABC):
     """
     Abstract base class for all trading strategies.
-    
+
     Strategies must implement generate_signals() which takes a DataFrame
     and returns a Series of signals (1, 0, -1).
+
+    generate_signals is expected to be vectorized: pure numpy/pandas
+    column operations or numba kernels, never a Python loop over bars.
+    Vectorized implementations release the GIL inside their numeric
+    kernels, which lets multi-symbol runs parallelize with threads
+    instead of paying process spawn + pickle overhead. A strategy that
+    genuinely cannot satisfy this should set `vectorized = False` so
+    callers know to schedule it on a process pool.
     """
-    
+
+    # Contract flag: generate_signals runs as vectorized numpy/numba
+    # code (GIL-friendly). Override to False for per-bar Python loops.
+    vectorized: bool = True
+
     def __init__(self, name: str, symbol: str):
         """
         Initialize strategy.
@@ -55,6 +72,44 @@ class BaseStrategy(ABC):
         """
         pass
     
+    def generate_signals_cached(self, data: pd.DataFrame) -> pd.Series:
+        """
+        Memoized wrapper around generate_signals.
+
+        Keyed on the strategy class, its parameters and a fingerprint
+        of the frame (first/last timestamp and length), so reruns over
+        the same data — parameter sweeps, repeated backtests — cost a
+        dict lookup instead of recomputing every indicator.
+
+        Args:
+            data: DataFrame with columns [open, high, low, close, volume]
+
+        Returns:
+            Series with index=datetime, values=signal (1, 0, -1)
+        """
+        # Public attributes only: underscore state (indicator caches)
+        # mutates with use and would make the key miss on every rerun
+        params = tuple(
+            sorted(
+                (k, repr(v))
+                for k, v in self.__dict__.items()
+                if not k.startswith("_")
+            )
+        )
+        key = (
+            type(self).__name__,
+            data.index[0].value,
+            data.index[-1].value,
+            len(data),
+            params,
+        )
+
+        signals = _signal_cache.get(key)
+        if signals is None:
+            signals = self.generate_signals(data)
+            _signal_cache[key] = signals
+        return signals
+
     def validate(self) -> bool:
         """Validate strategy parameters. Override if needed."""
         return True
@@ -7,16 +7,142 @@ Trend Following Strategy
 """
 
 import logging
-from typing import Optional
+from dataclasses import dataclass
+from typing import Dict, Optional
 
 import numpy as np
 import pandas as pd
+from cachetools import LRUCache
 
 from config.settings import StrategyConfig, get_config
+from utils._njit import HAS_NUMBA
+from ._jit import _adx_kernel, _ema_loop, _ema_triple, _ema_triple_batch
 from .base_strategy import BaseStrategy, SignalOutput
 
 logger = logging.getLogger(__name__)
 
+try:
+    import numexpr as ne
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+
+
+def _signal_masks(ef, es, el, c, adx, threshold):
+    """
+    Buy/sell condition masks over the indicator arrays.
+
+    With numexpr the three comparisons and their combination run as
+    one threaded, L1-blocked pass; otherwise plain numpy, which
+    materializes a bool temporary per comparison.
+    """
+    if HAS_NUMEXPR:
+        local = {"ef": ef, "es": es, "el": el, "c": c, "adx": adx,
+                 "t": float(threshold)}
+        buy = ne.evaluate("(ef > es) & (c > el) & (adx > t)", local_dict=local)
+        sell = ne.evaluate("(ef < es) | (c < el)", local_dict=local)
+    else:
+        buy = (ef > es) & (c > el) & (adx > threshold)
+        sell = (ef < es) | (c < el)
+    return buy, sell
+
+
+@dataclass(slots=True)
+class StreamingState:
+    """
+    O(1)-per-bar state for the trend strategy's live path.
+
+    The vectorized kernels are pure recursions, so their state per bar
+    is a handful of floats: three EMA levels and the Wilder ADX sums.
+    step() advances them by one bar and returns the signal the
+    vectorized path would emit for that bar - the live execution loop
+    never re-runs O(N) indicators per tick.
+    """
+    alpha_fast: float
+    alpha_slow: float
+    alpha_long: float
+    adx_period: int
+    adx_threshold: float
+
+    n: int = 0
+    ema_fast: float = 0.0
+    ema_slow: float = 0.0
+    ema_long: float = 0.0
+    prev_high: float = 0.0
+    prev_low: float = 0.0
+    prev_close: float = 0.0
+    adx_str: float = 0.0
+    adx_spdm: float = 0.0
+    adx_smdm: float = 0.0
+    adx_dx_sum: float = 0.0
+    adx: float = 0.0
+
+    def step(self, high: float, low: float, close: float) -> int:
+        """Advance one bar; returns the signal (1=long, 0=flat)."""
+        i = self.n
+        self.n = i + 1
+
+        if i == 0:
+            self.ema_fast = close
+            self.ema_slow = close
+            self.ema_long = close
+            self.prev_high = high
+            self.prev_low = low
+            self.prev_close = close
+            return 0
+
+        self.ema_fast = self.alpha_fast * close + (1.0 - self.alpha_fast) * self.ema_fast
+        self.ema_slow = self.alpha_slow * close + (1.0 - self.alpha_slow) * self.ema_slow
+        self.ema_long = self.alpha_long * close + (1.0 - self.alpha_long) * self.ema_long
+
+        # Same Wilder recurrence as _adx_kernel, one bar at a time
+        up = high - self.prev_high
+        dn = self.prev_low - low
+        pdm = up if (up > dn and up > 0.0) else 0.0
+        mdm = dn if (dn > up and dn > 0.0) else 0.0
+        tr = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_high = high
+        self.prev_low = low
+        self.prev_close = close
+
+        p = self.adx_period
+        if i <= p:
+            self.adx_str += tr
+            self.adx_spdm += pdm
+            self.adx_smdm += mdm
+        else:
+            self.adx_str += tr - self.adx_str / p
+            self.adx_spdm += pdm - self.adx_spdm / p
+            self.adx_smdm += mdm - self.adx_smdm / p
+
+        if i >= p:
+            if self.adx_str > 0.0:
+                pdi = 100.0 * self.adx_spdm / self.adx_str
+                mdi = 100.0 * self.adx_smdm / self.adx_str
+            else:
+                pdi = 0.0
+                mdi = 0.0
+            di_sum = pdi + mdi
+            dx = 100.0 * abs(pdi - mdi) / di_sum if di_sum > 0.0 else 0.0
+
+            if i < 2 * p - 1:
+                self.adx_dx_sum += dx
+            elif i == 2 * p - 1:
+                self.adx_dx_sum += dx
+                self.adx = self.adx_dx_sum / p
+            else:
+                self.adx = (self.adx * (p - 1) + dx) / p
+
+        if self.ema_fast < self.ema_slow or close < self.ema_long:
+            return 0
+        if (
+            self.ema_fast > self.ema_slow
+            and close > self.ema_long
+            and self.adx > self.adx_threshold
+        ):
+            return 1
+        return 0
+
 
 class TrendFollowingStrategy(BaseStrategy):
     """
@@ -41,7 +167,33 @@ class TrendFollowingStrategy(BaseStrategy):
         assert self.config.ema_long > self.config.ema_slow
         assert self.config.adx_threshold > 0
         assert self.config.atr_multiplier > 0
-    
+
+        # Indicator arrays keyed on the frame identity (last bar, length);
+        # optimizer sweeps and repeated runs over the same window skip
+        # the EMA/ADX recompute entirely. Params are fixed per instance,
+        # so they are not part of the key.
+        self._indicator_cache: LRUCache = LRUCache(maxsize=8)
+
+    def _indicators(self, data: pd.DataFrame):
+        """EMA triple and ADX for `data`, cached per (last bar, length)."""
+        key = (data.index[-1].value, len(data))
+        cached = self._indicator_cache.get(key)
+        if cached is not None:
+            return cached
+
+        close_arr = data["close"].to_numpy(dtype=np.float32, copy=False)
+        ema_fast, ema_slow, ema_long = _ema_triple(
+            close_arr,
+            2.0 / (self.config.ema_fast + 1.0),
+            2.0 / (self.config.ema_slow + 1.0),
+            2.0 / (self.config.ema_long + 1.0),
+        )
+        adx = self._calc_adx(data).to_numpy()
+
+        result = (close_arr, ema_fast, ema_slow, ema_long, adx)
+        self._indicator_cache[key] = result
+        return result
+
     def generate_signals(self, data: pd.DataFrame) -> pd.Series:
         """
         Generate trend following signals.
@@ -55,55 +207,177 @@ class TrendFollowingStrategy(BaseStrategy):
         if len(data) < self.config.ema_long:
             return pd.Series(0, index=data.index)
         
-        # Calculate indicators
-        ema_fast = self._calc_ema(data["close"], self.config.ema_fast)
-        ema_slow = self._calc_ema(data["close"], self.config.ema_slow)
-        ema_long = self._calc_ema(data["close"], self.config.ema_long)
-        adx = self._calc_adx(data)
-        
-        # Generate signals
-        signals = pd.Series(0, index=data.index)
-        
-        buy_condition = (ema_fast > ema_slow) & (data["close"] > ema_long) & (adx > self.config.adx_threshold)
-        sell_condition = (ema_fast < ema_slow) | (data["close"] < ema_long)
-        
-        signals[buy_condition] = 1
-        signals[sell_condition] = 0
-        
-        return signals.fillna(0)
+        # Calculate indicators; the three EMAs share one fused pass and
+        # everything stays numpy until the single Series wrap at return.
+        # float32 is zero-copy against the normalized cache layout
+        close_arr, ema_fast, ema_slow, ema_long, adx = self._indicators(data)
+
+        buy_condition, sell_condition = _signal_masks(
+            ema_fast, ema_slow, ema_long, close_arr, adx,
+            self.config.adx_threshold,
+        )
+
+        # Sell overrides buy, matching the old sequential mask writes
+        signals = np.where(sell_condition, 0, np.where(buy_condition, 1, 0)).astype(np.int8)
+
+        return pd.Series(signals, index=data.index, copy=False)
     
+    def streaming_state(self, adx_period: int = 14) -> StreamingState:
+        """Fresh per-bar streaming state configured like this strategy."""
+        return StreamingState(
+            alpha_fast=2.0 / (self.config.ema_fast + 1.0),
+            alpha_slow=2.0 / (self.config.ema_slow + 1.0),
+            alpha_long=2.0 / (self.config.ema_long + 1.0),
+            adx_period=adx_period,
+            adx_threshold=self.config.adx_threshold,
+        )
+
+    @classmethod
+    def generate_signals_batch(
+        cls,
+        data_by_symbol: Dict[str, pd.DataFrame],
+        config: Optional[StrategyConfig] = None,
+    ) -> Dict[str, pd.Series]:
+        """
+        Generate signals for many symbols in one call.
+
+        The EMA stage - the serial recurrence that dominates signal
+        time - runs through the threaded batch kernel: per-symbol
+        close arrays are stacked into a NaN-padded (symbols, bars)
+        matrix and each row is smoothed on its own core. ADX and the
+        masks then run per symbol as usual. Output matches calling
+        generate_signals symbol by symbol.
+
+        Args:
+            data_by_symbol: Dict of {symbol: OHLCV DataFrame}
+            config: StrategyConfig (uses system config if None)
+
+        Returns:
+            Dict of {symbol: signal Series}
+        """
+        config = config or get_config().strategy
+        results: Dict[str, pd.Series] = {}
+
+        # Short series never trade; handle them up front like
+        # generate_signals does
+        batch = []
+        for symbol, data in data_by_symbol.items():
+            if len(data) < config.ema_long:
+                results[symbol] = pd.Series(0, index=data.index)
+            else:
+                batch.append((symbol, data))
+        if not batch:
+            return results
+
+        n = max(len(data) for _, data in batch)
+        closes = np.full((len(batch), n), np.nan, dtype=np.float32)
+        for r, (_, data) in enumerate(batch):
+            closes[r, : len(data)] = data["close"].to_numpy(
+                dtype=np.float32, copy=False
+            )
+
+        ema_fast, ema_slow, ema_long = _ema_triple_batch(
+            closes,
+            2.0 / (config.ema_fast + 1.0),
+            2.0 / (config.ema_slow + 1.0),
+            2.0 / (config.ema_long + 1.0),
+        )
+
+        for r, (symbol, data) in enumerate(batch):
+            m = len(data)
+            close_arr = closes[r, :m]
+            adx = cls._calc_adx(data).to_numpy()
+
+            buy_condition, sell_condition = _signal_masks(
+                ema_fast[r, :m], ema_slow[r, :m], ema_long[r, :m],
+                close_arr, adx, config.adx_threshold,
+            )
+            signals = np.where(
+                sell_condition, 0, np.where(buy_condition, 1, 0)
+            ).astype(np.int8)
+            results[symbol] = pd.Series(signals, index=data.index, copy=False)
+
+        return results
+
     @staticmethod
     def _calc_ema(close: pd.Series, period: int) -> pd.Series:
-        """Calculate EMA."""
-        return close.ewm(span=period, adjust=False).mean()
+        """Calculate EMA (JIT loop; same recursion as ewm adjust=False)."""
+        arr = close.to_numpy(dtype=np.float32, copy=False)
+        alpha = 2.0 / (period + 1.0)
+        return pd.Series(_ema_loop(arr, alpha), index=close.index, copy=False)
     
     @staticmethod
     def _calc_adx(data: pd.DataFrame, period: int = 14) -> pd.Series:
-        """Calculate ADX (simplified)."""
+        """
+        Calculate ADX with Wilder smoothing.
+
+        Uses the single-pass numba kernel when available; otherwise a
+        pandas ewm-based approximation (Wilder smoothing is ewm with
+        alpha=1/period, differing only in how the seed is formed).
+        """
+        if HAS_NUMBA:
+            adx = _adx_kernel(
+                data["high"].to_numpy(dtype=np.float32, copy=False),
+                data["low"].to_numpy(dtype=np.float32, copy=False),
+                data["close"].to_numpy(dtype=np.float32, copy=False),
+                period,
+            )
+            return pd.Series(adx, index=data.index, copy=False)
+        return TrendFollowingStrategy._calc_adx_pandas(data, period)
+
+    @staticmethod
+    def _calc_adx_pandas(data: pd.DataFrame, period: int = 14) -> pd.Series:
+        """
+        ADX fallback without numba, built on pandas ewm.
+
+        The smoothing stays on pandas (ewm is a compiled recursion),
+        but the DI/DX arithmetic between the smoothing steps runs as
+        in-place numpy ufuncs into two reused buffers instead of a
+        fresh Series per operation.
+        """
         high = data["high"]
         low = data["low"]
         close = data["close"]
-        
-        plus_dm = high.diff()
-        plus_dm[plus_dm < 0] = 0
-        
-        minus_dm = -low.diff()
-        minus_dm[minus_dm < 0] = 0
-        
+
+        up = high.diff()
+        dn = -low.diff()
+        plus_dm = up.where((up > dn) & (up > 0), 0.0)
+        minus_dm = dn.where((dn > up) & (dn > 0), 0.0)
+
+        # Previous close built once as a plain array; the old code
+        # paid for close.shift(1) twice inside the TR expression
+        close_arr = close.to_numpy()
+        close_prev = np.empty_like(close_arr)
+        close_prev[0] = np.nan
+        close_prev[1:] = close_arr[:-1]
+
         tr = np.maximum(
             high - low,
             np.maximum(
-                abs(high - close.shift(1)),
-                abs(low - close.shift(1)),
+                abs(high - close_prev),
+                abs(low - close_prev),
             ),
         )
-        
-        plus_di = 100 * (plus_dm.rolling(period).mean() / tr.rolling(period).mean())
-        minus_di = 100 * (minus_dm.rolling(period).mean() / tr.rolling(period).mean())
-        
-        di_diff = abs(plus_di - minus_di)
-        di_sum = plus_di + minus_di
-        
-        adx = 100 * (di_diff / di_sum).rolling(period).mean()
-        
+
+        alpha = 1.0 / period
+        atr = tr.ewm(alpha=alpha, adjust=False).mean().to_numpy()
+        plus_di = plus_dm.ewm(alpha=alpha, adjust=False).mean().to_numpy().copy()
+        minus_di = minus_dm.ewm(alpha=alpha, adjust=False).mean().to_numpy().copy()
+
+        # DI ratios and DX in place: plus_di/minus_di double as scratch
+        # and diff_buf/sum_buf absorb every intermediate after them
+        np.divide(plus_di, atr, out=plus_di)
+        plus_di *= 100.0
+        np.divide(minus_di, atr, out=minus_di)
+        minus_di *= 100.0
+
+        diff_buf = np.subtract(plus_di, minus_di)
+        np.abs(diff_buf, out=diff_buf)
+        sum_buf = np.add(plus_di, minus_di, out=plus_di)
+        np.divide(diff_buf, sum_buf, out=diff_buf)
+        diff_buf *= 100.0
+
+        dx = pd.Series(diff_buf, index=data.index, copy=False)
+        adx = dx.ewm(alpha=alpha, adjust=False).mean()
+
         return adx.fillna(0)
@@ -6,16 +6,113 @@ Mean Reversion Strategy
 """
 
 import logging
+from dataclasses import dataclass, field
 from typing import Optional
 
 import numpy as np
 import pandas as pd
 
 from config.settings import StrategyConfig, get_config
+from utils._njit import HAS_NUMBA
+from ._jit import _bb_kernel, _mean_rev_signals, _rsi_kernel
 from .base_strategy import BaseStrategy, SignalOutput
 
 logger = logging.getLogger(__name__)
 
+try:
+    import bottleneck as bn
+    HAS_BOTTLENECK = True
+except ImportError:
+    HAS_BOTTLENECK = False
+
+
+@dataclass(slots=True)
+class StreamingState:
+    """
+    O(1)-per-bar state for the mean-reversion strategy's live path.
+
+    Wilder RSI state is two floats; the Bollinger window keeps its
+    running sums plus a ring buffer of the last `bb_period` closes so
+    the oldest value can be subtracted back out. step() advances one
+    bar and returns the signal the fused kernel would emit for that
+    bar - no O(N) recompute per tick.
+    """
+    rsi_period: int
+    bb_period: int
+    num_std: float
+    rsi_entry: float
+    rsi_exit: float
+
+    n: int = 0
+    prev_close: float = 0.0
+    avg_gain: float = 0.0
+    avg_loss: float = 0.0
+    bb_s: float = 0.0
+    bb_s2: float = 0.0
+    bb_window: np.ndarray = field(default=None)  # type: ignore[assignment]
+
+    def __post_init__(self):
+        if self.bb_window is None:
+            self.bb_window = np.zeros(self.bb_period)
+
+    def step(self, close: float) -> int:
+        """Advance one bar; returns the signal (1=long, 0=flat)."""
+        i = self.n
+        self.n = i + 1
+        p = self.rsi_period
+
+        # Wilder RSI state, same recurrence as the fused kernel
+        if i >= 1:
+            d = close - self.prev_close
+            gain = d if d > 0.0 else 0.0
+            loss = -d if d < 0.0 else 0.0
+            if i <= p:
+                self.avg_gain += gain
+                self.avg_loss += loss
+                if i == p:
+                    self.avg_gain /= p
+                    self.avg_loss /= p
+            else:
+                self.avg_gain = (self.avg_gain * (p - 1) + gain) / p
+                self.avg_loss = (self.avg_loss * (p - 1) + loss) / p
+        self.prev_close = close
+
+        if i < p:
+            rsi = 50.0
+        elif self.avg_loss > 0.0:
+            rsi = 100.0 - 100.0 / (1.0 + self.avg_gain / self.avg_loss)
+        elif self.avg_gain > 0.0:
+            rsi = 100.0
+        else:
+            rsi = 50.0
+
+        # Bollinger ring buffer and running sums
+        bp = self.bb_period
+        slot = i % bp
+        if i >= bp:
+            old = self.bb_window[slot]
+            self.bb_s -= old
+            self.bb_s2 -= old * old
+        self.bb_window[slot] = close
+        self.bb_s += close
+        self.bb_s2 += close * close
+
+        if i < bp - 1:
+            # Bands undefined: stay flat
+            return 0
+
+        mean = self.bb_s / bp
+        var = (self.bb_s2 - bp * mean * mean) / (bp - 1)
+        if var < 0.0:
+            var = 0.0
+        band = self.num_std * np.sqrt(var)
+
+        if rsi > self.rsi_exit or close > mean + band:
+            return 0
+        if rsi < self.rsi_entry and close < mean - band:
+            return 1
+        return 0
+
 
 class MeanReversionStrategy(BaseStrategy):
     """
@@ -53,49 +150,101 @@ class MeanReversionStrategy(BaseStrategy):
         """
         if len(data) < max(self.config.rsi_period, self.config.bb_period):
             return pd.Series(0, index=data.index)
-        
-        # Calculate indicators
-        rsi = self._calc_rsi(data["close"], self.config.rsi_period)
-        upper_bb, middle_bb, lower_bb = self._calc_bollinger_bands(
-            data["close"],
-            self.config.bb_period,
-            self.config.bb_std_dev,
+
+        if HAS_NUMBA:
+            # RSI, Bollinger Bands and the entry/exit masks fused into
+            # one pass over the close column
+            signals = _mean_rev_signals(
+                data["close"].to_numpy(dtype=np.float32, copy=False),
+                self.config.rsi_period,
+                self.config.bb_period,
+                self.config.bb_std_dev,
+                self.config.rsi_entry,
+                self.config.rsi_exit,
+            )
+            return pd.Series(signals, index=data.index, copy=False)
+
+        # Without numba, compose the C-level fallbacks instead of
+        # letting the fused kernel run as an interpreted Python loop
+        rsi = self._calc_rsi(data["close"], self.config.rsi_period).to_numpy()
+        upper, _, lower = self._calc_bollinger_bands(
+            data["close"], self.config.bb_period, self.config.bb_std_dev
         )
-        
-        # Generate signals
-        signals = pd.Series(0, index=data.index)
-        
-        buy_condition = (rsi < self.config.rsi_entry) & (data["close"] < lower_bb)
-        exit_condition = (rsi > self.config.rsi_exit) | (data["close"] > upper_bb)
-        
-        signals[buy_condition] = 1
-        signals[exit_condition] = 0
-        
-        return signals.fillna(0)
+        close_arr = data["close"].to_numpy()
+
+        buy = (rsi < self.config.rsi_entry) & (close_arr < lower.to_numpy())
+        sell = (rsi > self.config.rsi_exit) | (close_arr > upper.to_numpy())
+        signals = np.where(sell, 0, np.where(buy, 1, 0)).astype(np.int8)
+
+        return pd.Series(signals, index=data.index, copy=False)
     
+    def streaming_state(self) -> StreamingState:
+        """Fresh per-bar streaming state configured like this strategy."""
+        return StreamingState(
+            rsi_period=self.config.rsi_period,
+            bb_period=self.config.bb_period,
+            num_std=self.config.bb_std_dev,
+            rsi_entry=self.config.rsi_entry,
+            rsi_exit=self.config.rsi_exit,
+        )
+
     @staticmethod
     def _calc_rsi(close: pd.Series, period: int = 14) -> pd.Series:
-        """Calculate RSI (Relative Strength Index)."""
+        """
+        Calculate RSI with Wilder smoothing.
+
+        Single JIT pass when numba is available; otherwise pandas ewm
+        with alpha=1/period, which is the same recursion and differs
+        only in how the seed is formed (like the ADX fallback).
+        """
+        if HAS_NUMBA:
+            rsi = _rsi_kernel(close.to_numpy(dtype=np.float32, copy=False), period)
+            return pd.Series(rsi, index=close.index, copy=False)
+
         delta = close.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi.fillna(50)
-    
+        gain = delta.clip(lower=0.0)
+        loss = -delta.clip(upper=0.0)
+        alpha = 1.0 / period
+        avg_gain = gain.ewm(alpha=alpha, adjust=False).mean()
+        avg_loss = loss.ewm(alpha=alpha, adjust=False).mean()
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        return rsi.fillna(50.0)
+
     @staticmethod
     def _calc_bollinger_bands(
         close: pd.Series,
         period: int,
         std_dev: float,
     ) -> tuple[pd.Series, pd.Series, pd.Series]:
-        """Calculate Bollinger Bands."""
-        sma = close.rolling(period).mean()
-        std = close.rolling(period).std()
-        
-        upper = sma + (std_dev * std)
-        lower = sma - (std_dev * std)
-        
-        return upper, sma, lower
+        """
+        Calculate Bollinger Bands.
+
+        Single JIT pass over window sums when numba is available, then
+        bottleneck's C-level move_mean/move_std, then pandas rolling
+        as the last resort.
+        """
+        if HAS_NUMBA:
+            upper, mid, lower = _bb_kernel(
+                close.to_numpy(dtype=np.float32, copy=False), period, std_dev
+            )
+            return (
+                pd.Series(upper, index=close.index, copy=False),
+                pd.Series(mid, index=close.index, copy=False),
+                pd.Series(lower, index=close.index, copy=False),
+            )
+
+        if HAS_BOTTLENECK:
+            arr = close.to_numpy(dtype=np.float64)
+            mean = bn.move_mean(arr, period, min_count=period)
+            std = bn.move_std(arr, period, min_count=period, ddof=1)
+        else:
+            rolling = close.rolling(window=period)
+            mean = rolling.mean().to_numpy()
+            std = rolling.std().to_numpy()
+
+        band = std_dev * std
+        return (
+            pd.Series(mean + band, index=close.index, copy=False),
+            pd.Series(mean, index=close.index, copy=False),
+            pd.Series(mean - band, index=close.index, copy=False),
+        )
@@ -0,0 +1,27 @@
+"""
+Optional numba shim.
+
+Exposes `njit` that falls back to a no-op decorator when numba is not
+installed, so JIT-compiled hot paths degrade to plain Python instead of
+raising ImportError. Check `HAS_NUMBA` to branch to a vectorized
+pandas/numpy path where a pure-Python loop would be too slow.
+"""
+
+try:
+    from numba import njit, prange  # noqa: F401
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    # prange degrades to a plain serial range
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (accepts signatures/options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap